@@ -45,6 +45,7 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import signal
 import sys
 from pathlib import Path
@@ -59,6 +60,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger('mcp-server')
 
+# orjson serializes straight to bytes and is much faster than stdlib json;
+# every JSON-RPC frame flows through these two aliases
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str, ensure_ascii=False).encode()
+
+    _loads = json.loads
+
 # Add systerd_lite to path and use venv if available
 script_dir = Path(__file__).parent.resolve()
 venv_site_packages = script_dir / ".venv" / "lib"
@@ -88,6 +104,11 @@ class MCPServerCore:
         self.context: Optional[SysterdContext] = None
         self.mcp: Optional[MCPHandler] = None
         self.initialized = False
+        # (name, schema) pairs computed once at init; the tool set is
+        # fixed, so to_schema() never needs to run on the request path
+        self._all_tools_schema: List[tuple] = []
+        self._enabled_cache: Optional[List[Dict[str, Any]]] = None
+        self._perm_mtime: Any = -1  # sentinel: never matches a real mtime
 
     def initialize(self):
         """Initialize the systerd context and MCP handler."""
@@ -111,29 +132,49 @@ class MCPServerCore:
         )
 
         self.mcp = MCPHandler(self.context)
+        self._all_tools_schema = [
+            (name, tool.to_schema()) for name, tool in self.mcp.tools.items()
+        ]
         self.initialized = True
         logger.info(f"MCP Server initialized with {len(self.mcp.tools)} tools")
 
+    def _refresh_permissions(self):
+        """Re-read permissions.json only when its mtime changed.
+
+        Also drops the enabled-tools cache on change, so callers just
+        call this and then read the caches.
+        """
+        try:
+            mtime = os.stat(self.context.permission_manager.config_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._perm_mtime:
+            self.context.permission_manager.load()
+            self._perm_mtime = mtime
+            self._enabled_cache = None
+
     def get_enabled_tools(self) -> List[Dict[str, Any]]:
         """Get list of enabled tools only (respecting permissions)."""
         if not self.mcp:
             return []
-        
+
+        self._refresh_permissions()
+        if self._enabled_cache is not None:
+            return self._enabled_cache
+
         perm_mgr = self.context.permission_manager
-        enabled_tools = []
-        
-        for name, tool in self.mcp.tools.items():
-            perm = perm_mgr.check(name)
-            if perm != Permission.DISABLED:
-                enabled_tools.append(tool.to_schema())
-        
+        enabled_tools = [
+            schema for name, schema in self._all_tools_schema
+            if perm_mgr.check(name) != Permission.DISABLED
+        ]
+        self._enabled_cache = enabled_tools
         return enabled_tools
 
     def get_all_tools(self) -> List[Dict[str, Any]]:
         """Get all tools regardless of permission status."""
         if not self.mcp:
             return []
-        return [tool.to_schema() for tool in self.mcp.tools.values()]
+        return [schema for _, schema in self._all_tools_schema]
 
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool and return result."""
@@ -143,9 +184,9 @@ class MCPServerCore:
         if name not in self.mcp.tools:
             raise ValueError(f"Tool not found: {name}")
         
-        # Reload permissions to get fresh state
-        self.context.permission_manager.load()
-        
+        # Reload permissions only if the file changed on disk
+        self._refresh_permissions()
+
         # Check permission
         perm = self.context.permission_manager.check(name)
         if perm == Permission.DISABLED:
@@ -172,8 +213,7 @@ class MCPServerCore:
 
     async def handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/list request - returns only enabled tools."""
-        # Reload permissions to get fresh state
-        self.context.permission_manager.load()
+        # get_enabled_tools reloads permissions if the file changed
         tools = self.get_enabled_tools()
         return {"tools": tools}
 
@@ -186,7 +226,7 @@ class MCPServerCore:
             raise ValueError("Missing tool name")
         
         result = await self.call_tool(name, arguments)
-        content = [{"type": "text", "text": json.dumps(result, default=str, ensure_ascii=False)}]
+        content = [{"type": "text", "text": _dumps(result).decode()}]
         return {"content": content}
 
     async def handle_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -210,46 +250,79 @@ class MCPServerCore:
 class StdioTransport:
     """stdio transport for VS Code LocalProcess and Claude Desktop."""
 
+    # Concurrent message handlers; bounds how many slow tools/call
+    # invocations can be in flight without stalling the read loop
+    NUM_WORKERS = 4
+    QUEUE_SIZE = 256
+
     def __init__(self, core: MCPServerCore):
         self.core = core
         self.running = False
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._write_lock = asyncio.Lock()
+
+    async def _connect_pipes(self):
+        """Attach stdin/stdout to the event loop as asyncio streams.
+
+        Reads are then served straight from the selector instead of
+        hopping through the thread-pool executor for every line, and
+        writes get real backpressure via drain().
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        self._reader = reader
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, sys.stdout)
+        self._writer = asyncio.StreamWriter(transport, protocol, None, loop)
 
     async def read_message(self) -> Optional[Dict[str, Any]]:
         """Read a JSON-RPC message from stdin."""
-        loop = asyncio.get_event_loop()
         try:
-            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if self._reader is not None:
+                line = await self._reader.readline()
+            else:
+                loop = asyncio.get_event_loop()
+                line = await loop.run_in_executor(None, sys.stdin.buffer.readline)
             if not line:
                 return None
             line = line.strip()
             if not line:
                 return None
             logger.debug(f"Received: {line[:200]}...")
-            return json.loads(line)
-        except json.JSONDecodeError as e:
+            return _loads(line)
+        except ValueError as e:
             logger.error(f"JSON decode error: {e}")
             return None
         except Exception as e:
             logger.error(f"Read error: {e}")
             return None
 
-    def write_message(self, message: Dict[str, Any]):
+    async def write_message(self, message: Dict[str, Any]):
         """Write a JSON-RPC message to stdout."""
-        line = json.dumps(message, ensure_ascii=False)
-        sys.stdout.write(line + "\n")
-        sys.stdout.flush()
+        line = _dumps(message)
+        # Workers run concurrently; the lock keeps frames from interleaving
+        async with self._write_lock:
+            if self._writer is not None:
+                self._writer.write(line + b"\n")
+                await self._writer.drain()
+            else:
+                sys.stdout.buffer.write(line + b"\n")
+                sys.stdout.buffer.flush()
         logger.debug(f"Sent: {line[:200]}...")
 
-    def send_error(self, msg_id: Any, code: int, message: str, data: Any = None):
+    async def send_error(self, msg_id: Any, code: int, message: str, data: Any = None):
         """Send a JSON-RPC error response."""
         error = {"code": code, "message": message}
         if data is not None:
             error["data"] = data
-        self.write_message({"jsonrpc": "2.0", "id": msg_id, "error": error})
+        await self.write_message({"jsonrpc": "2.0", "id": msg_id, "error": error})
 
-    def send_result(self, msg_id: Any, result: Any):
+    async def send_result(self, msg_id: Any, result: Any):
         """Send a JSON-RPC result response."""
-        self.write_message({"jsonrpc": "2.0", "id": msg_id, "result": result})
+        await self.write_message({"jsonrpc": "2.0", "id": msg_id, "result": result})
 
     async def handle_message(self, message: Dict[str, Any]) -> None:
         """Handle a single JSON-RPC message."""
@@ -270,27 +343,53 @@ class StdioTransport:
         # Requests (have id) - response required
         try:
             result = await self.core.handle_request(method, params)
-            self.send_result(msg_id, result)
+            await self.send_result(msg_id, result)
         except PermissionError as e:
-            self.send_error(msg_id, -32001, str(e))
+            await self.send_error(msg_id, -32001, str(e))
         except ValueError as e:
-            self.send_error(msg_id, -32602, str(e))
+            await self.send_error(msg_id, -32602, str(e))
         except Exception as e:
             logger.exception(f"Error handling {method}: {e}")
-            self.send_error(msg_id, -32603, str(e))
+            await self.send_error(msg_id, -32603, str(e))
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """Drain queued messages until the None shutdown sentinel."""
+        while True:
+            message = await queue.get()
+            if message is None:
+                break
+            await self.handle_message(message)
 
     async def run(self):
         """Main server loop."""
         logger.info("Starting MCP stdio server...")
         self.core.initialize()
 
+        try:
+            await self._connect_pipes()
+        except (OSError, ValueError) as e:
+            # stdin/stdout may not be pollable (e.g. redirected to a
+            # regular file); keep the executor-based path in that case
+            logger.warning(f"Falling back to blocking stdio: {e}")
+
+        # Decouple reads from handler execution: a slow tools/call must
+        # not block the next read_message, but the bounded queue still
+        # applies backpressure if the client floods us
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        workers = [asyncio.create_task(self._worker(queue))
+                   for _ in range(self.NUM_WORKERS)]
+
         self.running = True
         while self.running:
             message = await self.read_message()
             if message is None:
                 logger.info("End of input, shutting down")
                 break
-            await self.handle_message(message)
+            await queue.put(message)
+
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
 
         logger.info("MCP stdio server stopped")
 
@@ -482,8 +581,8 @@ class SSETransport:
             while True:
                 try:
                     message = await asyncio.wait_for(queue.get(), timeout=30)
-                    event = f"event: message\ndata: {json.dumps(message)}\n\n"
-                    await response.write(event.encode())
+                    event = b"event: message\ndata: " + _dumps(message) + b"\n\n"
+                    await response.write(event)
                 except asyncio.TimeoutError:
                     # Send keepalive
                     await response.write(b": keepalive\n\n")
@@ -528,6 +627,15 @@ class SSETransport:
 
 
 def main():
+    # uvloop is a drop-in libuv event loop with noticeably lower I/O and
+    # task-dispatch overhead; fall back to the default loop when absent
+    # (it is Linux/macOS only)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(
         description='systerd-lite Unified MCP Server',
         formatter_class=argparse.RawDescriptionHelpFormatter,
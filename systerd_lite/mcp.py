@@ -904,6 +904,17 @@ class MCPHandler:
     ):
         self.tools[name] = MCPTool(name, description, handler, parameters)
 
+    def register_batch(self, specs) -> None:
+        """
+        Register many tools at once from (name, description, handler, parameters)
+        rows. One dict update instead of a method call per tool; dispatch stays
+        a single hash lookup in self.tools.
+        """
+        self.tools.update({
+            name: MCPTool(name, description, handler, parameters)
+            for name, description, handler, parameters in specs
+        })
+
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """
         Execute a tool by name with arguments.
@@ -1286,7 +1297,9 @@ class MCPHandler:
     async def tool_read_journald(self, unit: str = None, priority: int = None, lines: int = 50) -> List[str]:
         import subprocess
         
-        cmd = ["journalctl", "-n", str(lines), "--no-pager"]
+        # --no-hostname and short-iso trim repeated decoration journald
+        # would otherwise send over the pipe for every line
+        cmd = ["journalctl", "-n", str(lines), "--no-pager", "--no-hostname", "-o", "short-iso"]
         if unit:
             cmd.extend(["-u", unit])
         if priority is not None:
@@ -1413,7 +1426,7 @@ class MCPHandler:
         return await client.suggest_optimization(metrics)
 
     async def tool_ai_set_model(self, model: str) -> Dict[str, Any]:
-        await self.ollama.set_default_model(model)
+        self.ollama.set_default_model(model)
         return {"status": "ok", "model": model}
 
     async def tool_ai_list_models(self) -> List[str]:
@@ -1684,7 +1697,7 @@ class MCPHandler:
             "get_temperature", "get_battery_status", "get_top_processes", "get_zombie_processes",
             "get_system_info", "list_processes", "monitor_realtime", "get_system_metrics",
             "get_service_health", "list_zombie_processes", "get_process_tree", "get_memory_map",
-            "lsof_process", "strace_process"
+            "lsof_process", "strace_process", "snapshot_processes"
         ],
         "security": [
             "get_selinux_status", "get_apparmor_status", "list_sudo_rules", "audit_permissions",
@@ -1702,9 +1715,10 @@ class MCPHandler:
             "enable_unit", "disable_unit", "mask_unit", "unmask_unit", "reload_systemd",
             "list_timers", "set_default_target", "get_failed_units", "reset_failed_units",
             "list_sockets", "analyze_blame", "analyze_critical_chain", "edit_unit", "cat_unit",
-            "start_service", "stop_service", "restart_service", "reload_service", "reboot_system",
+            "manage_unit", "systemctl_batch", "reboot_system",
             "get_kernel_version", "list_kernel_modules", "load_kernel_module", "unload_kernel_module",
-            "get_kernel_cmdline", "list_cgroups", "get_cgroup_stats", "set_cgroup_limit",
+            "get_kernel_cmdline", "list_cgroups", "get_cgroup_stats", "get_cgroup_stats_batch",
+            "set_cgroup_limit",
             "list_namespaces", "get_capabilities", "get_sysctl", "set_sysctl", "list_cron_jobs",
             "get_mode", "set_mode", "get_permissions", "list_devices", "control_device",
             "read_neurobus", "read_journald", "analyze_logs", "get_boot_messages", "clear_journal",
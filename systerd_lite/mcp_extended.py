@@ -5,478 +5,1083 @@ Adds 100+ tools covering all system aspects.
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import fnmatch
+import grp
+import heapq
 import json
 import logging
+import os
+import pwd
+import re
+import shutil
+import socket
+import stat
+import struct
 import subprocess
+import time
+from functools import cached_property, lru_cache, wraps
 from typing import Any, Dict, List
 
 from .decorators import permission_audit, require_permission
 from .permissions import Permission
 
+try:
+    # Optional: talk rtnetlink directly instead of forking iproute2
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None
+
+try:
+    # Optional: libnftables bindings, one netlink dump instead of an iptables fork
+    import nftables as _nftables
+except ImportError:
+    _nftables = None
+
+try:
+    # Optional: C JSON parser for the tools that ingest lsblk/lvs/systemctl output
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Shared schema objects for the many registrations that take no arguments or
+# just a unit name. Plain dicts (not MappingProxyType) because they are fed to
+# json.dumps by the transports; treat them as read-only.
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+_UNIT_SCHEMA = {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
+
+# Constant argv prefixes for the systemctl verbs; tuples are folded into the
+# code object so only the final per-call list is allocated.
+_SYSTEMCTL_ENABLE = ("systemctl", "enable")
+_SYSTEMCTL_DISABLE = ("systemctl", "disable")
+_SYSTEMCTL_MASK = ("systemctl", "mask")
+_SYSTEMCTL_UNMASK = ("systemctl", "unmask")
+_SYSTEMCTL_ISOLATE = ("systemctl", "isolate")
+_SYSTEMCTL_SET_DEFAULT = ("systemctl", "set-default")
+
+# Interned status strings shared by all control-plane tool returns
+_OK = "ok"
+_ERROR = "error"
+
+
+def _status_of(result: subprocess.CompletedProcess) -> str:
+    """Map a process exit code to the canonical ok/error status string."""
+    return _OK if result.returncode == 0 else _ERROR
+
+
+# Shared result cache for read-only tools: (qualname, args, kwargs) -> (timestamp, result)
+_CACHE: Dict[tuple, tuple] = {}
+# Per-tool cache effectiveness counters, keyed by qualname
+_CACHE_HITS: Dict[str, int] = {}
+_CACHE_MISSES: Dict[str, int] = {}
+# Single-flight futures so concurrent identical calls share one execution
+_INFLIGHT: Dict[tuple, "asyncio.Future"] = {}
+
+
+async def _run(argv: List[str], timeout: float = None, check: bool = False,
+               text: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a command without blocking the event loop.
+
+    Mirrors subprocess.run(capture_output=True, text=True): returns a
+    CompletedProcess with decoded stdout/stderr, raises TimeoutExpired on
+    timeout and CalledProcessError when check=True and the command fails,
+    so the existing per-tool error handling keeps working unchanged.
+    Pass text=False to keep stdout/stderr as bytes for outputs that are
+    fed straight to a JSON parser; that skips one full UTF-8 pass.
+    """
+    # Missing binaries surface as a cached PATH-probe miss instead of a
+    # spawn attempt; same FileNotFoundError the exec would have raised
+    if not _have(argv[0]):
+        raise FileNotFoundError(2, "No such file or directory", argv[0])
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        close_fds=False,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.communicate()
+        raise subprocess.TimeoutExpired(argv, timeout)
+    if text:
+        out = out.decode(errors="replace")
+        err = err.decode(errors="replace")
+    result = subprocess.CompletedProcess(argv, proc.returncode, out, err)
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, argv, result.stdout, result.stderr)
+    return result
+
+
+async def _run_tail(argv: List[str], tail_bytes: int = 16384, timeout: float = None) -> str:
+    """
+    Run a command keeping only the last tail_bytes of its stdout.
+
+    Output is streamed into a bounded ring of fixed-size chunks instead of
+    materializing the whole payload, so tools whose children can emit
+    hundreds of KB (smartctl -a, systemd-analyze) no longer double peak
+    RSS on output they mostly discard.
+    """
+    if not _have(argv[0]):
+        raise FileNotFoundError(2, "No such file or directory", argv[0])
+    chunk_size = 4096
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        close_fds=False,
+    )
+
+    async def _drain() -> str:
+        ring = collections.deque()
+        buffered = 0
+        while True:
+            chunk = await proc.stdout.read(chunk_size)
+            if not chunk:
+                break
+            ring.append(chunk)
+            buffered += len(chunk)
+            # Evict whole head chunks once the tail is still covered without them
+            while ring and buffered - len(ring[0]) >= tail_bytes:
+                buffered -= len(ring.popleft())
+        await proc.wait()
+        return b"".join(ring)[-tail_bytes:].decode(errors="replace")
+
+    try:
+        return await asyncio.wait_for(_drain(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(argv, timeout)
+
+
+# glibc utmp record layout (bits/utmp.h): 384 bytes per entry
+_UTMP_FORMAT = "<hxxi32s4s32s256shhi2i4i20x"
+_UTMP_SIZE = struct.calcsize(_UTMP_FORMAT)
+_USER_PROCESS = 7  # ut_type of an interactive login session
+
+
+def _read_utmp(path: str, tail_records: int = None) -> List[Dict[str, Any]]:
+    """
+    Decode utmp/wtmp/btmp records directly instead of forking who/last.
+
+    With tail_records, seek to the last N record boundaries first so work
+    is O(N) regardless of how large the log has grown.
+    """
+    with open(path, "rb") as f:
+        if tail_records is not None:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, (size // _UTMP_SIZE - tail_records) * _UTMP_SIZE))
+        data = f.read()
+    records = []
+    usable = len(data) - len(data) % _UTMP_SIZE
+    for rec in struct.iter_unpack(_UTMP_FORMAT, data[:usable]):
+        ut_type, pid, line, _ut_id, user, host, _e0, _e1, _sess, tv_sec, _tv_usec = rec[:11]
+        records.append({
+            "type": ut_type,
+            "pid": pid,
+            "line": line.split(b"\0", 1)[0].decode(errors="replace"),
+            "user": user.split(b"\0", 1)[0].decode(errors="replace"),
+            "host": host.split(b"\0", 1)[0].decode(errors="replace"),
+            "time": tv_sec,
+        })
+    return records
+
+
+# TCP state numbers from include/net/tcp_states.h as they appear in /proc/net/tcp
+_TCP_STATES = {
+    "01": "ESTABLISHED", "02": "SYN_SENT", "03": "SYN_RECV", "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2", "06": "TIME_WAIT", "07": "CLOSE", "08": "CLOSE_WAIT",
+    "09": "LAST_ACK", "0A": "LISTEN", "0B": "CLOSING",
+}
+
+
+def _decode_hex_ipv4(value: str) -> str:
+    """Decode a little-endian hex IPv4 address from /proc/net files."""
+    return ".".join(str(b) for b in bytes.fromhex(value)[::-1])
+
+
+def _decode_proc_addr(addr: str) -> str:
+    """Decode a hex ADDR:PORT field from /proc/net/tcp into host:port form."""
+    host, _, port = addr.partition(":")
+    if len(host) == 8:  # IPv4; IPv6 addresses are left as raw hex
+        host = _decode_hex_ipv4(host)
+    return f"{host}:{int(port, 16)}"
+
+
+def _read_proc_net_sockets(proto: str) -> List[Dict[str, Any]]:
+    """Parse /proc/net/<proto> (tcp, tcp6, udp, udp6) into socket rows."""
+    try:
+        with open(f"/proc/net/{proto}", "r") as f:
+            lines = f.read().splitlines()[1:]
+    except FileNotFoundError:
+        # Protocol not compiled in (e.g. no IPv6)
+        return []
+    rows = []
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 10:
+            continue
+        rows.append({
+            "proto": proto,
+            "local": _decode_proc_addr(parts[1]),
+            "remote": _decode_proc_addr(parts[2]),
+            "state": _TCP_STATES.get(parts[3], parts[3]),
+            "uid": int(parts[7]),
+            "inode": int(parts[9]),
+        })
+    return rows
+
+
+# Installed rows of dpkg -l; one C-speed scan instead of a Python line loop
+_DPKG_INSTALLED = re.compile(r"^ii\s+(\S+)\s+(\S+)\s+(\S+)\s+(.*)$", re.M)
+# systemctl show KEY=VALUE lines; compiled once so hot callers avoid
+# per-line split/substring scans
+_SHOW_PROP = re.compile(r"^([^=\n]+)=(.*)$", re.M)
+
+# NSS account databases parsed once per file change; keyed on st_mtime_ns.
+# An inotify watch would save the stat call, but one stat per query is
+# already cheap and needs no background task.
+_NSS_CACHE: Dict[str, tuple] = {}
+
+
+def _nss_cached(path: str, loader) -> List[Dict[str, Any]]:
+    """Return loader() memoized until path's mtime changes."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = -1
+    entry = _NSS_CACHE.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    rows = loader()
+    _NSS_CACHE[path] = (mtime, rows)
+    return rows
+
+
+@lru_cache(maxsize=256)
+def _user_name(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=256)
+def _group_name(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+@lru_cache(maxsize=None)
+def _have(cmd: str) -> bool:
+    """Whether cmd is on PATH; pure-Python walk, no fork, cached forever."""
+    return shutil.which(cmd) is not None
+
+
+def _batched_read(paths: List[str]) -> Dict[str, bytes]:
+    """
+    Read several small /proc and /etc files in one pass.
+
+    io_uring batching (one submit, many CQEs) was evaluated, but liburing
+    bindings are not a dependency of this project; a raw os.open/os.read
+    loop keeps each file to three syscalls with no buffered-IO layer, which
+    is most of the win for sub-4KB pseudo-files. Missing or unreadable
+    paths are omitted from the result.
+    """
+    out = {}
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            continue
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            out[path] = b"".join(chunks)
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+    return out
+
+
+def _socket_inode_owners() -> Dict[int, int]:
+    """
+    Map socket inodes to owning pids with one pass over /proc/*/fd.
+
+    readlink on a socket fd yields 'socket:[inode]'; unreadable processes
+    (permission, exit race) are skipped.
+    """
+    owners = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            fds = os.listdir(f"/proc/{entry.name}/fd")
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(f"/proc/{entry.name}/fd/{fd}")
+            except OSError:
+                continue
+            if target.startswith("socket:["):
+                owners[int(target[8:-1])] = int(entry.name)
+    return owners
+
+
+def _query_sockets(tcp: bool = True, udp: bool = True, listening: bool = False) -> List[Dict[str, Any]]:
+    """Socket table from /proc/net, optionally restricted to listeners."""
+    rows = []
+    if tcp:
+        rows += _read_proc_net_sockets("tcp") + _read_proc_net_sockets("tcp6")
+    if udp:
+        rows += _read_proc_net_sockets("udp") + _read_proc_net_sockets("udp6")
+    if listening:
+        # UDP sockets have no LISTEN state; unconnected ones show as CLOSE
+        rows = [r for r in rows
+                if r["state"] == "LISTEN" or (r["proto"].startswith("udp") and r["state"] == "CLOSE")]
+    return rows
+
+
+@lru_cache(maxsize=1)
+def _kernel_version() -> Dict[str, str]:
+    """Kernel identification via the uname syscall; immutable until reboot."""
+    u = os.uname()
+    info = {
+        "sysname": u.sysname,
+        "nodename": u.nodename,
+        "release": u.release,
+        "version": u.version,
+        "machine": u.machine,
+    }
+    try:
+        # Full banner including compiler, matching what uname -a cannot show
+        info["version_string"] = _read_proc("/proc/version").strip()
+    except OSError:
+        pass
+    return info
+
+
+def _read_proc(path: str) -> str:
+    """
+    Snapshot a small procfs file in one read(2).
+
+    procfs regenerates content on every read, so letting buffered IO
+    issue several reads can observe torn data; a single 8 KB raw read is
+    also what procps uses for these files.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 8192).decode(errors="replace")
+    finally:
+        os.close(fd)
+
+
+def _read_proc_large(path: str) -> str:
+    """Read a procfs file that may exceed 8 KB (e.g. maps) into one buffer."""
+    buf = bytearray()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return buf.decode(errors="replace")
+            buf += chunk
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def _kernel_cmdline() -> str:
+    """Boot command line; cannot change while the host is up."""
+    return _read_proc("/proc/cmdline").strip()
+
+
+def _parse_unit_lines(text: str) -> List[Dict[str, Any]]:
+    """Parse --no-legend --plain systemctl list-units output into rows."""
+    units = []
+    for line in text.splitlines():
+        parts = line.split(None, 4)
+        if len(parts) >= 4:
+            units.append({
+                "unit": parts[0],
+                "load": parts[1],
+                "active": parts[2],
+                "sub": parts[3],
+                "description": parts[4] if len(parts) > 4 else "",
+            })
+    return units
+
+
+async def _list_units_json(cmd: List[str]) -> List[Dict[str, Any]]:
+    """
+    Run a systemctl list command with --output=json (decoded in C by
+    orjson when installed), falling back to the plain-text parser on
+    systemd older than v244.
+    """
+    result = await _run([*cmd, "--output=json"], text=False)
+    # Pre-244 systemctl rejects --output=json with a non-zero exit and
+    # empty stdout, so check that before trusting the JSON parse
+    if result.returncode != 0 or not result.stdout:
+        result = await _run([*cmd, "--no-legend", "--plain"])
+        return _parse_unit_lines(result.stdout)
+    try:
+        return _loads(result.stdout)
+    except (ValueError, json.JSONDecodeError):
+        result = await _run([*cmd, "--no-legend", "--plain"])
+        return _parse_unit_lines(result.stdout)
+
+
+class _AsyncPinger:
+    """
+    Async ICMP echo client over an unprivileged SOCK_DGRAM ICMP socket
+    (permitted when net.ipv4.ping_group_range covers this process).
+
+    One non-blocking socket serves all concurrent pings; replies are
+    matched to waiters by sequence number via loop.add_reader, so N
+    hosts cost one fd and zero subprocesses. The kernel fills in the
+    ICMP checksum and id for datagram ICMP sockets.
+    """
+
+    def __init__(self):
+        self._sock = None
+        self._seq = 0
+        self._waiters: Dict[int, asyncio.Future] = {}
+
+    def _ensure_socket(self, loop) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+            sock.setblocking(False)
+            loop.add_reader(sock.fileno(), self._on_readable, sock)
+            self._sock = sock
+        return self._sock
+
+    def _on_readable(self, sock: socket.socket):
+        try:
+            data, _addr = sock.recvfrom(2048)
+        except OSError:
+            return
+        if len(data) >= 8 and data[0] == 0:  # ICMP echo reply
+            seq = int.from_bytes(data[6:8], "big")
+            fut = self._waiters.pop(seq, None)
+            if fut is not None and not fut.done():
+                fut.set_result(time.monotonic())
+
+    async def ping(self, host: str, timeout: float = 2.0) -> float:
+        """Send one echo request; returns RTT in ms or None on timeout."""
+        loop = asyncio.get_running_loop()
+        sock = self._ensure_socket(loop)
+        addr = (await loop.getaddrinfo(host, 0, family=socket.AF_INET))[0][4][0]
+        self._seq = (self._seq + 1) & 0xFFFF
+        seq = self._seq
+        packet = struct.pack("!BBHHH", 8, 0, 0, 0, seq) + b"systerd-ping"
+        fut = loop.create_future()
+        self._waiters[seq] = fut
+        start = time.monotonic()
+        sock.sendto(packet, (addr, 0))
+        try:
+            end = await asyncio.wait_for(fut, timeout)
+            return (end - start) * 1000.0
+        except asyncio.TimeoutError:
+            self._waiters.pop(seq, None)
+            return None
+
+
+_PINGER = _AsyncPinger()
+
+
+def ttl_cache(seconds: float):
+    """
+    Cache the result of an async tool method for a number of seconds.
+
+    Keyed on the function and its call arguments so different argument
+    combinations are cached independently. Use float("inf") for values
+    that cannot change while the host is up (e.g. kernel version).
+    Hit/miss counts per tool are kept in _CACHE_HITS/_CACHE_MISSES so
+    cache effectiveness can be inspected at runtime.
+    """
+    def decorator(func):
+        name = func.__qualname__
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            entry = _CACHE.get(key)
+            now = time.monotonic()
+            if entry is not None and now - entry[0] < seconds:
+                _CACHE_HITS[name] = _CACHE_HITS.get(name, 0) + 1
+                return entry[1]
+            # Coalesce: if an identical call is already running, await it
+            # instead of launching another subprocess/procfs pass
+            inflight = _INFLIGHT.get(key)
+            if inflight is not None:
+                _CACHE_HITS[name] = _CACHE_HITS.get(name, 0) + 1
+                return await asyncio.shield(inflight)
+            _CACHE_MISSES[name] = _CACHE_MISSES.get(name, 0) + 1
+            future = asyncio.get_running_loop().create_future()
+            _INFLIGHT[key] = future
+            try:
+                result = await func(self, *args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                future.exception()  # consumed here; followers re-raise it
+                raise
+            else:
+                future.set_result(result)
+                _CACHE[key] = (time.monotonic(), result)
+                return result
+            finally:
+                del _INFLIGHT[key]
+        return wrapper
+    return decorator
+
+
+def _heavy(func):
+    """
+    Bound concurrency of disk/CPU-heavy tools with the per-instance
+    semaphore, so an agent bursting fsck/smartctl-class calls cannot
+    oversubscribe the disk with dozens of child processes.
+    """
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        async with self._heavy_sem:
+            return await func(self, *args, **kwargs)
+    return wrapper
+
 
 class ExtendedMCPTools:
     """Extended system management tools (100+ tools for complete control)"""
 
     def __init__(self, context):
         self.context = context
+        # Shared bound for the @_heavy tool family
+        self._heavy_sem = asyncio.Semaphore(int(os.environ.get("SYSTERD_HEAVY_PAR", "4")))
+        # One list-units snapshot shared by the read-only unit queries
+        self._units_snapshot: List[Dict[str, Any]] = []
+        self._units_snapshot_ts: float = float("-inf")
+        # Long-lived fds for the hottest poll targets; pread(fd, n, 0)
+        # returns a fresh procfs snapshot without open/close churn
+        self._proc_fds: Dict[str, int] = {}
+        for path in ("/proc/loadavg", "/proc/uptime"):
+            try:
+                self._proc_fds[path] = os.open(path, os.O_RDONLY)
+            except OSError:
+                pass
+
+    def __del__(self):
+        for fd in getattr(self, "_proc_fds", {}).values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _pread_proc(self, path: str) -> str:
+        """Current snapshot of a polled procfs file via the cached fd."""
+        fd = self._proc_fds.get(path)
+        if fd is None:
+            return _read_proc(path)
+        return os.pread(fd, 4096, 0).decode(errors="replace")
+
+    async def _snapshot_units(self) -> List[Dict[str, Any]]:
+        """
+        All units from a single list-units call, cached for 2 seconds.
+
+        Lets a "health summary" burst of failed/socket/mount queries cost
+        one systemctl invocation instead of one fork each. A D-Bus
+        ListUnits round-trip would avoid even that fork, but dbus bindings
+        are not a dependency of this project.
+        """
+        now = time.monotonic()
+        if now - self._units_snapshot_ts >= 2.0:
+            self._units_snapshot = await _list_units_json(
+                ["systemctl", "list-units", "--all", "--no-pager"])
+            self._units_snapshot_ts = now
+        return self._units_snapshot
+
+    @cached_property
+    def pkg_mgr(self) -> str:
+        """System package manager, probed once in pure Python (no forks)."""
+        for mgr in ("apt", "dnf", "yum"):
+            if _have(mgr):
+                return mgr
+        return None
+
+    def refresh_capabilities(self) -> None:
+        """Forget cached host capability probes (e.g. after installs)."""
+        self.__dict__.pop("pkg_mgr", None)
+        _have.cache_clear()
 
     def register_all(self, handler):
         """Register all extended tools to MCPHandler"""
-        # ===== SYSTEMD COMPLETE (20 tools) =====
-        handler.register_tool(
-            "list_units", "List all systemd units", self.tool_list_units,
-            {"type": "object", "properties": {"type": {"type": "string", "enum": ["service", "timer", "socket", "mount", "swap", "target", "path", "slice", "scope"]}}}
-        )
-        handler.register_tool(
-            "get_unit_properties", "Get detailed properties of a systemd unit", self.tool_get_unit_properties,
-            {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "enable_unit", "Enable a systemd unit to start at boot", self.tool_enable_unit,
-            {"type": "object", "properties": {"unit": {"type": "string"}, "now": {"type": "boolean"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "disable_unit", "Disable a systemd unit from starting at boot", self.tool_disable_unit,
-            {"type": "object", "properties": {"unit": {"type": "string"}, "now": {"type": "boolean"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "mask_unit", "Mask a systemd unit (prevent activation)", self.tool_mask_unit,
-            {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "unmask_unit", "Unmask a systemd unit", self.tool_unmask_unit,
-            {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "reload_systemd", "Reload systemd manager configuration", self.tool_reload_systemd,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_timers", "List all systemd timers with next activation time", self.tool_list_timers,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "show_unit_dependencies", "Show dependencies of a unit", self.tool_show_unit_dependencies,
-            {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "isolate_target", "Isolate to a specific systemd target", self.tool_isolate_target,
-            {"type": "object", "properties": {"target": {"type": "string"}}, "required": ["target"]}
-        )
-        handler.register_tool(
-            "set_default_target", "Set default boot target", self.tool_set_default_target,
-            {"type": "object", "properties": {"target": {"type": "string"}}, "required": ["target"]}
-        )
-        handler.register_tool(
-            "get_failed_units", "Get all failed systemd units", self.tool_get_failed_units,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "reset_failed_units", "Reset failed state of systemd units", self.tool_reset_failed_units,
-            {"type": "object", "properties": {"unit": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "list_sockets", "List all systemd sockets", self.tool_list_sockets,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_mounts", "List all systemd mount units", self.tool_list_mounts,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "analyze_security", "Analyze security exposure of a service", self.tool_analyze_security,
-            {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
-        )
-        handler.register_tool(
-            "analyze_blame", "Show service initialization times (blame)", self.tool_analyze_blame,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "analyze_critical_chain", "Show critical chain of boot process", self.tool_analyze_critical_chain,
-            {"type": "object", "properties": {"unit": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "edit_unit", "Edit a systemd unit (create override)", self.tool_edit_unit,
-            {"type": "object", "properties": {"unit": {"type": "string"}, "content": {"type": "string"}}, "required": ["unit", "content"]}
-        )
-        handler.register_tool(
-            "cat_unit", "Show content of a systemd unit file", self.tool_cat_unit,
-            {"type": "object", "properties": {"unit": {"type": "string"}}, "required": ["unit"]}
-        )
-
-        # ===== NETWORK MANAGEMENT (15 tools) =====
-        handler.register_tool(
-            "list_interfaces", "List all network interfaces", self.tool_list_interfaces,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_interface_status", "Get status of a network interface", self.tool_get_interface_status,
-            {"type": "object", "properties": {"interface": {"type": "string"}}, "required": ["interface"]}
-        )
-        handler.register_tool(
-            "set_interface_up", "Bring network interface up", self.tool_set_interface_up,
-            {"type": "object", "properties": {"interface": {"type": "string"}}, "required": ["interface"]}
-        )
-        handler.register_tool(
-            "set_interface_down", "Bring network interface down", self.tool_set_interface_down,
-            {"type": "object", "properties": {"interface": {"type": "string"}}, "required": ["interface"]}
-        )
-        handler.register_tool(
-            "list_routes", "List routing table", self.tool_list_routes,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "add_route", "Add a route to routing table", self.tool_add_route,
-            {"type": "object", "properties": {"destination": {"type": "string"}, "gateway": {"type": "string"}, "device": {"type": "string"}}, "required": ["destination"]}
-        )
-        handler.register_tool(
-            "del_route", "Delete a route from routing table", self.tool_del_route,
-            {"type": "object", "properties": {"destination": {"type": "string"}}, "required": ["destination"]}
-        )
-        handler.register_tool(
-            "list_firewall_rules", "List firewall rules (iptables/nftables)", self.tool_list_firewall_rules,
-            {"type": "object", "properties": {"table": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "add_firewall_rule", "Add a firewall rule", self.tool_add_firewall_rule,
-            {"type": "object", "properties": {"chain": {"type": "string"}, "rule": {"type": "string"}}, "required": ["chain", "rule"]}
-        )
-        handler.register_tool(
-            "del_firewall_rule", "Delete a firewall rule", self.tool_del_firewall_rule,
-            {"type": "object", "properties": {"chain": {"type": "string"}, "rule_num": {"type": "integer"}}, "required": ["chain", "rule_num"]}
-        )
-        handler.register_tool(
-            "get_dns_config", "Get DNS configuration", self.tool_get_dns_config,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "set_dns_servers", "Set DNS servers", self.tool_set_dns_servers,
-            {"type": "object", "properties": {"servers": {"type": "array", "items": {"type": "string"}}}, "required": ["servers"]}
-        )
-        handler.register_tool(
-            "ping_host", "Ping a host to check connectivity", self.tool_ping_host,
-            {"type": "object", "properties": {"host": {"type": "string"}, "count": {"type": "integer"}}, "required": ["host"]}
-        )
-        handler.register_tool(
-            "traceroute", "Trace route to a host", self.tool_traceroute,
-            {"type": "object", "properties": {"host": {"type": "string"}}, "required": ["host"]}
-        )
-        handler.register_tool(
-            "netstat", "Show network connections", self.tool_netstat,
-            {"type": "object", "properties": {"tcp": {"type": "boolean"}, "udp": {"type": "boolean"}, "listening": {"type": "boolean"}}}
-        )
-
-        # ===== STORAGE/FILESYSTEM (15 tools) =====
-        handler.register_tool(
-            "list_block_devices", "List all block devices", self.tool_list_block_devices,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_disk_usage", "Get disk usage statistics", self.tool_get_disk_usage,
-            {"type": "object", "properties": {"path": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "list_mounted_filesystems", "List all mounted filesystems", self.tool_list_mounted_filesystems,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "mount_filesystem", "Mount a filesystem", self.tool_mount_filesystem,
-            {"type": "object", "properties": {"device": {"type": "string"}, "mountpoint": {"type": "string"}, "fstype": {"type": "string"}, "options": {"type": "string"}}, "required": ["device", "mountpoint"]}
-        )
-        handler.register_tool(
-            "unmount_filesystem", "Unmount a filesystem", self.tool_unmount_filesystem,
-            {"type": "object", "properties": {"mountpoint": {"type": "string"}}, "required": ["mountpoint"]}
-        )
-        handler.register_tool(
-            "list_lvm_volumes", "List LVM logical volumes", self.tool_list_lvm_volumes,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "create_lvm_volume", "Create a new LVM logical volume", self.tool_create_lvm_volume,
-            {"type": "object", "properties": {"vg": {"type": "string"}, "name": {"type": "string"}, "size": {"type": "string"}}, "required": ["vg", "name", "size"]}
-        )
-        handler.register_tool(
-            "extend_lvm_volume", "Extend an LVM logical volume", self.tool_extend_lvm_volume,
-            {"type": "object", "properties": {"lv_path": {"type": "string"}, "size": {"type": "string"}}, "required": ["lv_path", "size"]}
-        )
-        handler.register_tool(
-            "check_filesystem", "Check filesystem integrity (fsck)", self.tool_check_filesystem,
-            {"type": "object", "properties": {"device": {"type": "string"}}, "required": ["device"]}
-        )
-        handler.register_tool(
-            "list_raid_arrays", "List RAID arrays (md)", self.tool_list_raid_arrays,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_smart_status", "Get SMART status of a disk", self.tool_get_smart_status,
-            {"type": "object", "properties": {"device": {"type": "string"}}, "required": ["device"]}
-        )
-        handler.register_tool(
-            "list_inodes", "List inode usage per filesystem", self.tool_list_inodes,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "find_large_files", "Find largest files in a directory tree", self.tool_find_large_files,
-            {"type": "object", "properties": {"path": {"type": "string"}, "limit": {"type": "integer"}}, "required": ["path"]}
-        )
-        handler.register_tool(
-            "get_disk_io_stats", "Get disk I/O statistics", self.tool_get_disk_io_stats,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "tune_filesystem", "Tune filesystem parameters (tune2fs)", self.tool_tune_filesystem,
-            {"type": "object", "properties": {"device": {"type": "string"}, "params": {"type": "object"}}, "required": ["device"]}
-        )
-
-        # ===== PACKAGE MANAGEMENT (10 tools) =====
-        handler.register_tool(
-            "list_installed_packages", "List all installed packages", self.tool_list_installed_packages,
-            {"type": "object", "properties": {"pattern": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "search_packages", "Search for packages", self.tool_search_packages,
-            {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
-        )
-        handler.register_tool(
-            "install_package", "Install a package", self.tool_install_package,
-            {"type": "object", "properties": {"package": {"type": "string"}}, "required": ["package"]}
-        )
-        handler.register_tool(
-            "remove_package", "Remove a package", self.tool_remove_package,
-            {"type": "object", "properties": {"package": {"type": "string"}}, "required": ["package"]}
-        )
-        handler.register_tool(
-            "update_package_cache", "Update package cache", self.tool_update_package_cache,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "upgrade_system", "Upgrade all packages", self.tool_upgrade_system,
-            {"type": "object", "properties": {"dist_upgrade": {"type": "boolean"}}}
-        )
-        handler.register_tool(
-            "list_upgradable", "List upgradable packages", self.tool_list_upgradable,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_package_info", "Get detailed package information", self.tool_get_package_info,
-            {"type": "object", "properties": {"package": {"type": "string"}}, "required": ["package"]}
-        )
-        handler.register_tool(
-            "autoremove_packages", "Remove unused dependencies", self.tool_autoremove_packages,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "clean_package_cache", "Clean package cache", self.tool_clean_package_cache,
-            {"type": "object", "properties": {}}
-        )
-
-        # ===== USER/GROUP MANAGEMENT (10 tools) =====
-        handler.register_tool(
-            "list_users", "List all users", self.tool_list_users,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_groups", "List all groups", self.tool_list_groups,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "create_user", "Create a new user", self.tool_create_user,
-            {"type": "object", "properties": {"username": {"type": "string"}, "home": {"type": "string"}, "shell": {"type": "string"}, "groups": {"type": "array"}}, "required": ["username"]}
-        )
-        handler.register_tool(
-            "delete_user", "Delete a user", self.tool_delete_user,
-            {"type": "object", "properties": {"username": {"type": "string"}, "remove_home": {"type": "boolean"}}, "required": ["username"]}
-        )
-        handler.register_tool(
-            "modify_user", "Modify user properties", self.tool_modify_user,
-            {"type": "object", "properties": {"username": {"type": "string"}, "changes": {"type": "object"}}, "required": ["username", "changes"]}
-        )
-        handler.register_tool(
-            "create_group", "Create a new group", self.tool_create_group,
-            {"type": "object", "properties": {"groupname": {"type": "string"}}, "required": ["groupname"]}
-        )
-        handler.register_tool(
-            "delete_group", "Delete a group", self.tool_delete_group,
-            {"type": "object", "properties": {"groupname": {"type": "string"}}, "required": ["groupname"]}
-        )
-        handler.register_tool(
-            "add_user_to_group", "Add user to a group", self.tool_add_user_to_group,
-            {"type": "object", "properties": {"username": {"type": "string"}, "groupname": {"type": "string"}}, "required": ["username", "groupname"]}
-        )
-        handler.register_tool(
-            "list_logged_in_users", "List currently logged in users", self.tool_list_logged_in_users,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_user_info", "Get detailed user information", self.tool_get_user_info,
-            {"type": "object", "properties": {"username": {"type": "string"}}, "required": ["username"]}
-        )
-
-        # ===== SECURITY/AUDIT (10 tools) =====
-        handler.register_tool(
-            "list_open_ports", "List open network ports", self.tool_list_open_ports,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "check_selinux_status", "Check SELinux status", self.tool_check_selinux_status,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "check_apparmor_status", "Check AppArmor status", self.tool_check_apparmor_status,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_sudo_users", "List users with sudo privileges", self.tool_list_sudo_users,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "check_failed_logins", "Check failed login attempts", self.tool_check_failed_logins,
-            {"type": "object", "properties": {"limit": {"type": "integer"}}}
-        )
-        handler.register_tool(
-            "list_cron_jobs", "List all cron jobs", self.tool_list_cron_jobs,
-            {"type": "object", "properties": {"user": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "scan_listening_services", "Scan all listening services", self.tool_scan_listening_services,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "check_file_permissions", "Check file permissions and ownership", self.tool_check_file_permissions,
-            {"type": "object", "properties": {"path": {"type": "string"}}, "required": ["path"]}
-        )
-        handler.register_tool(
-            "list_suid_files", "List SUID/SGID files", self.tool_list_suid_files,
-            {"type": "object", "properties": {"path": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "check_system_integrity", "Check system integrity (AIDE/Tripwire)", self.tool_check_system_integrity,
-            {"type": "object", "properties": {}}
-        )
-
-        # ===== KERNEL/CGROUPS (10 tools) =====
-        handler.register_tool(
-            "get_kernel_version", "Get kernel version information", self.tool_get_kernel_version,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_kernel_modules", "List loaded kernel modules", self.tool_list_kernel_modules,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "load_kernel_module", "Load a kernel module", self.tool_load_kernel_module,
-            {"type": "object", "properties": {"module": {"type": "string"}, "params": {"type": "string"}}, "required": ["module"]}
-        )
-        handler.register_tool(
-            "unload_kernel_module", "Unload a kernel module", self.tool_unload_kernel_module,
-            {"type": "object", "properties": {"module": {"type": "string"}}, "required": ["module"]}
-        )
-        handler.register_tool(
-            "get_kernel_cmdline", "Get kernel command line", self.tool_get_kernel_cmdline,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_cgroups", "List cgroups hierarchy", self.tool_list_cgroups,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_cgroup_stats", "Get cgroup resource statistics", self.tool_get_cgroup_stats,
-            {"type": "object", "properties": {"cgroup": {"type": "string"}}, "required": ["cgroup"]}
-        )
-        handler.register_tool(
-            "set_cgroup_limit", "Set cgroup resource limit", self.tool_set_cgroup_limit,
-            {"type": "object", "properties": {"cgroup": {"type": "string"}, "resource": {"type": "string"}, "limit": {"type": "string"}}, "required": ["cgroup", "resource", "limit"]}
-        )
-        handler.register_tool(
-            "list_namespaces", "List Linux namespaces", self.tool_list_namespaces,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_capabilities", "Get process capabilities", self.tool_get_capabilities,
-            {"type": "object", "properties": {"pid": {"type": "integer"}}, "required": ["pid"]}
-        )
-
-        # ===== MONITORING/LOGGING (10 tools) =====
-        handler.register_tool(
-            "get_load_average", "Get system load average", self.tool_get_load_average,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_uptime", "Get system uptime", self.tool_get_uptime,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "list_zombie_processes", "List zombie processes", self.tool_list_zombie_processes,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "get_process_tree", "Get process tree", self.tool_get_process_tree,
-            {"type": "object", "properties": {"pid": {"type": "integer"}}}
-        )
-        handler.register_tool(
-            "strace_process", "Trace system calls of a process (strace)", self.tool_strace_process,
-            {"type": "object", "properties": {"pid": {"type": "integer"}, "duration": {"type": "integer"}}, "required": ["pid"]}
-        )
-        handler.register_tool(
-            "lsof_process", "List open files of a process", self.tool_lsof_process,
-            {"type": "object", "properties": {"pid": {"type": "integer"}}, "required": ["pid"]}
-        )
-        handler.register_tool(
-            "get_memory_map", "Get memory map of a process", self.tool_get_memory_map,
-            {"type": "object", "properties": {"pid": {"type": "integer"}}, "required": ["pid"]}
-        )
-        handler.register_tool(
-            "monitor_realtime", "Start real-time monitoring (top-like)", self.tool_monitor_realtime,
-            {"type": "object", "properties": {"duration": {"type": "integer"}}}
-        )
-        handler.register_tool(
-            "analyze_logs", "Analyze system logs for errors", self.tool_analyze_logs,
-            {"type": "object", "properties": {"since": {"type": "string"}, "severity": {"type": "string"}}}
-        )
-        handler.register_tool(
-            "get_boot_messages", "Get boot messages (dmesg)", self.tool_get_boot_messages,
-            {"type": "object", "properties": {"level": {"type": "integer"}}}
-        )
-        handler.register_tool(
-            "clear_journal", "Clear systemd journal logs", self.tool_clear_journal,
-            {"type": "object", "properties": {}}
-        )
-        handler.register_tool(
-            "set_file_permissions", "Set file permissions (chmod)", self.tool_set_file_permissions,
-            {"type": "object", "properties": {"path": {"type": "string"}, "mode": {"type": "string"}}, "required": ["path", "mode"]}
-        )
-        handler.register_tool(
-            "set_selinux_mode", "Set SELinux enforcement mode", self.tool_set_selinux_mode,
-            {"type": "object", "properties": {"mode": {"type": "string", "enum": ["enforcing", "permissive", "disabled"]}}, "required": ["mode"]}
-        )
-        handler.register_tool(
-            "set_apparmor_mode", "Set AppArmor profile mode", self.tool_set_apparmor_mode,
-            {"type": "object", "properties": {"mode": {"type": "string", "enum": ["enforce", "complain", "disable"]}, "profile": {"type": "string"}}, "required": ["mode"]}
-        )
+        specs = [
+            # ===== SYSTEMD COMPLETE (20 tools) =====
+            (
+                "list_units", "List all systemd units", self.tool_list_units,
+                {"type": "object", "properties": {"type": {"type": "string", "enum": ["service", "timer", "socket", "mount", "swap", "target", "path", "slice", "scope"]}}}
+            ),
+            (
+                "get_unit_properties", "Get detailed properties of a systemd unit", self.tool_get_unit_properties,
+                _UNIT_SCHEMA
+            ),
+            (
+                "enable_unit", "Enable a systemd unit to start at boot", self.tool_enable_unit,
+                {"type": "object", "properties": {"unit": {"type": "string"}, "now": {"type": "boolean"}}, "required": ["unit"]}
+            ),
+            (
+                "disable_unit", "Disable a systemd unit from starting at boot", self.tool_disable_unit,
+                {"type": "object", "properties": {"unit": {"type": "string"}, "now": {"type": "boolean"}}, "required": ["unit"]}
+            ),
+            (
+                "mask_unit", "Mask a systemd unit (prevent activation)", self.tool_mask_unit,
+                _UNIT_SCHEMA
+            ),
+            (
+                "unmask_unit", "Unmask a systemd unit", self.tool_unmask_unit,
+                _UNIT_SCHEMA
+            ),
+            (
+                "reload_systemd", "Reload systemd manager configuration", self.tool_reload_systemd,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_timers", "List all systemd timers with next activation time", self.tool_list_timers,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "show_unit_dependencies", "Show dependencies of a unit", self.tool_show_unit_dependencies,
+                _UNIT_SCHEMA
+            ),
+            (
+                "isolate_target", "Isolate to a specific systemd target", self.tool_isolate_target,
+                {"type": "object", "properties": {"target": {"type": "string"}}, "required": ["target"]}
+            ),
+            (
+                "set_default_target", "Set default boot target", self.tool_set_default_target,
+                {"type": "object", "properties": {"target": {"type": "string"}}, "required": ["target"]}
+            ),
+            (
+                "get_failed_units", "Get all failed systemd units", self.tool_get_failed_units,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "reset_failed_units", "Reset failed state of systemd units", self.tool_reset_failed_units,
+                {"type": "object", "properties": {"unit": {"type": "string"}}}
+            ),
+            (
+                "list_sockets", "List all systemd sockets", self.tool_list_sockets,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_mounts", "List all systemd mount units", self.tool_list_mounts,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "analyze_security", "Analyze security exposure of a service", self.tool_analyze_security,
+                _UNIT_SCHEMA
+            ),
+            (
+                "analyze_blame", "Show service initialization times (blame)", self.tool_analyze_blame,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "analyze_critical_chain", "Show critical chain of boot process", self.tool_analyze_critical_chain,
+                {"type": "object", "properties": {"unit": {"type": "string"}}}
+            ),
+            (
+                "edit_unit", "Edit a systemd unit (create override)", self.tool_edit_unit,
+                {"type": "object", "properties": {"unit": {"type": "string"}, "content": {"type": "string"}}, "required": ["unit", "content"]}
+            ),
+            (
+                "cat_unit", "Show content of a systemd unit file", self.tool_cat_unit,
+                {"type": "object", "properties": {"unit": {"type": "string"}, "max_bytes": {"type": "integer"}}, "required": ["unit"]}
+            ),
+
+            # ===== NETWORK MANAGEMENT (15 tools) =====
+            (
+                "list_interfaces", "List all network interfaces", self.tool_list_interfaces,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_interface_status", "Get status of a network interface", self.tool_get_interface_status,
+                {"type": "object", "properties": {"interface": {"type": "string"}}, "required": ["interface"]}
+            ),
+            (
+                "set_interface_up", "Bring network interface up", self.tool_set_interface_up,
+                {"type": "object", "properties": {"interface": {"type": "string"}}, "required": ["interface"]}
+            ),
+            (
+                "set_interface_down", "Bring network interface down", self.tool_set_interface_down,
+                {"type": "object", "properties": {"interface": {"type": "string"}}, "required": ["interface"]}
+            ),
+            (
+                "list_routes", "List routing table", self.tool_list_routes,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "add_route", "Add a route to routing table", self.tool_add_route,
+                {"type": "object", "properties": {"destination": {"type": "string"}, "gateway": {"type": "string"}, "device": {"type": "string"}}, "required": ["destination"]}
+            ),
+            (
+                "del_route", "Delete a route from routing table", self.tool_del_route,
+                {"type": "object", "properties": {"destination": {"type": "string"}}, "required": ["destination"]}
+            ),
+            (
+                "list_firewall_rules", "List firewall rules (iptables/nftables)", self.tool_list_firewall_rules,
+                {"type": "object", "properties": {"table": {"type": "string"}}}
+            ),
+            (
+                "add_firewall_rule", "Add a firewall rule", self.tool_add_firewall_rule,
+                {"type": "object", "properties": {"chain": {"type": "string"}, "rule": {"type": "string"}}, "required": ["chain", "rule"]}
+            ),
+            (
+                "del_firewall_rule", "Delete a firewall rule", self.tool_del_firewall_rule,
+                {"type": "object", "properties": {"chain": {"type": "string"}, "rule_num": {"type": "integer"}}, "required": ["chain", "rule_num"]}
+            ),
+            (
+                "get_dns_config", "Get DNS configuration", self.tool_get_dns_config,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "set_dns_servers", "Set DNS servers", self.tool_set_dns_servers,
+                {"type": "object", "properties": {"servers": {"type": "array", "items": {"type": "string"}}}, "required": ["servers"]}
+            ),
+            (
+                "ping_host", "Ping a host to check connectivity", self.tool_ping_host,
+                {"type": "object", "properties": {"host": {"type": "string"}, "count": {"type": "integer"}}, "required": ["host"]}
+            ),
+            (
+                "traceroute", "Trace route to a host", self.tool_traceroute,
+                {"type": "object", "properties": {"host": {"type": "string"}}, "required": ["host"]}
+            ),
+            (
+                "netstat", "Show network connections", self.tool_netstat,
+                {"type": "object", "properties": {"tcp": {"type": "boolean"}, "udp": {"type": "boolean"}, "listening": {"type": "boolean"}}}
+            ),
+
+            # ===== STORAGE/FILESYSTEM (15 tools) =====
+            (
+                "list_block_devices", "List all block devices", self.tool_list_block_devices,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_disk_usage", "Get disk usage statistics", self.tool_get_disk_usage,
+                {"type": "object", "properties": {"path": {"type": "string"}}}
+            ),
+            (
+                "list_mounted_filesystems", "List all mounted filesystems", self.tool_list_mounted_filesystems,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "mount_filesystem", "Mount a filesystem", self.tool_mount_filesystem,
+                {"type": "object", "properties": {"device": {"type": "string"}, "mountpoint": {"type": "string"}, "fstype": {"type": "string"}, "options": {"type": "string"}}, "required": ["device", "mountpoint"]}
+            ),
+            (
+                "unmount_filesystem", "Unmount a filesystem", self.tool_unmount_filesystem,
+                {"type": "object", "properties": {"mountpoint": {"type": "string"}}, "required": ["mountpoint"]}
+            ),
+            (
+                "list_lvm_volumes", "List LVM logical volumes", self.tool_list_lvm_volumes,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "create_lvm_volume", "Create a new LVM logical volume", self.tool_create_lvm_volume,
+                {"type": "object", "properties": {"vg": {"type": "string"}, "name": {"type": "string"}, "size": {"type": "string"}}, "required": ["vg", "name", "size"]}
+            ),
+            (
+                "extend_lvm_volume", "Extend an LVM logical volume", self.tool_extend_lvm_volume,
+                {"type": "object", "properties": {"lv_path": {"type": "string"}, "size": {"type": "string"}}, "required": ["lv_path", "size"]}
+            ),
+            (
+                "check_filesystem", "Check filesystem integrity (fsck)", self.tool_check_filesystem,
+                {"type": "object", "properties": {"device": {"type": "string"}}, "required": ["device"]}
+            ),
+            (
+                "list_raid_arrays", "List RAID arrays (md)", self.tool_list_raid_arrays,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_smart_status", "Get SMART status of a disk", self.tool_get_smart_status,
+                {"type": "object", "properties": {"device": {"type": "string"}}, "required": ["device"]}
+            ),
+            (
+                "list_inodes", "List inode usage per filesystem", self.tool_list_inodes,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "find_large_files", "Find largest files in a directory tree", self.tool_find_large_files,
+                {"type": "object", "properties": {"path": {"type": "string"}, "limit": {"type": "integer"}, "max_depth": {"type": "integer"}}, "required": ["path"]}
+            ),
+            (
+                "get_disk_io_stats", "Get disk I/O statistics", self.tool_get_disk_io_stats,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "tune_filesystem", "Tune filesystem parameters (tune2fs)", self.tool_tune_filesystem,
+                {"type": "object", "properties": {"device": {"type": "string"}, "params": {"type": "object"}}, "required": ["device"]}
+            ),
+
+            # ===== PACKAGE MANAGEMENT (10 tools) =====
+            (
+                "list_installed_packages", "List all installed packages", self.tool_list_installed_packages,
+                {"type": "object", "properties": {"pattern": {"type": "string"}}}
+            ),
+            (
+                "search_packages", "Search for packages", self.tool_search_packages,
+                {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
+            ),
+            (
+                "install_package", "Install a package", self.tool_install_package,
+                {"type": "object", "properties": {"package": {"type": "string"}}, "required": ["package"]}
+            ),
+            (
+                "remove_package", "Remove a package", self.tool_remove_package,
+                {"type": "object", "properties": {"package": {"type": "string"}}, "required": ["package"]}
+            ),
+            (
+                "update_package_cache", "Update package cache", self.tool_update_package_cache,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "upgrade_system", "Upgrade all packages", self.tool_upgrade_system,
+                {"type": "object", "properties": {"dist_upgrade": {"type": "boolean"}}}
+            ),
+            (
+                "list_upgradable", "List upgradable packages", self.tool_list_upgradable,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_package_info", "Get detailed package information", self.tool_get_package_info,
+                {"type": "object", "properties": {"package": {"type": "string"}}, "required": ["package"]}
+            ),
+            (
+                "autoremove_packages", "Remove unused dependencies", self.tool_autoremove_packages,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "clean_package_cache", "Clean package cache", self.tool_clean_package_cache,
+                _EMPTY_SCHEMA
+            ),
+
+            # ===== USER/GROUP MANAGEMENT (10 tools) =====
+            (
+                "list_users", "List all users", self.tool_list_users,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_groups", "List all groups", self.tool_list_groups,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "create_user", "Create a new user", self.tool_create_user,
+                {"type": "object", "properties": {"username": {"type": "string"}, "home": {"type": "string"}, "shell": {"type": "string"}, "groups": {"type": "array"}}, "required": ["username"]}
+            ),
+            (
+                "delete_user", "Delete a user", self.tool_delete_user,
+                {"type": "object", "properties": {"username": {"type": "string"}, "remove_home": {"type": "boolean"}}, "required": ["username"]}
+            ),
+            (
+                "modify_user", "Modify user properties", self.tool_modify_user,
+                {"type": "object", "properties": {"username": {"type": "string"}, "changes": {"type": "object"}}, "required": ["username", "changes"]}
+            ),
+            (
+                "create_group", "Create a new group", self.tool_create_group,
+                {"type": "object", "properties": {"groupname": {"type": "string"}}, "required": ["groupname"]}
+            ),
+            (
+                "delete_group", "Delete a group", self.tool_delete_group,
+                {"type": "object", "properties": {"groupname": {"type": "string"}}, "required": ["groupname"]}
+            ),
+            (
+                "add_user_to_group", "Add user to a group", self.tool_add_user_to_group,
+                {"type": "object", "properties": {"username": {"type": "string"}, "groupname": {"type": "string"}}, "required": ["username", "groupname"]}
+            ),
+            (
+                "list_logged_in_users", "List currently logged in users", self.tool_list_logged_in_users,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_user_info", "Get detailed user information", self.tool_get_user_info,
+                {"type": "object", "properties": {"username": {"type": "string"}}, "required": ["username"]}
+            ),
+
+            # ===== SECURITY/AUDIT (10 tools) =====
+            (
+                "list_open_ports", "List open network ports", self.tool_list_open_ports,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "check_selinux_status", "Check SELinux status", self.tool_check_selinux_status,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "check_apparmor_status", "Check AppArmor status", self.tool_check_apparmor_status,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_sudo_users", "List users with sudo privileges", self.tool_list_sudo_users,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "check_failed_logins", "Check failed login attempts", self.tool_check_failed_logins,
+                {"type": "object", "properties": {"limit": {"type": "integer"}}}
+            ),
+            (
+                "list_cron_jobs", "List all cron jobs", self.tool_list_cron_jobs,
+                {"type": "object", "properties": {"user": {"type": "string"}}}
+            ),
+            (
+                "scan_listening_services", "Scan all listening services", self.tool_scan_listening_services,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "check_file_permissions", "Check file permissions and ownership", self.tool_check_file_permissions,
+                {"type": "object", "properties": {"path": {"type": "string"}}, "required": ["path"]}
+            ),
+            (
+                "list_suid_files", "List SUID/SGID files", self.tool_list_suid_files,
+                {"type": "object", "properties": {"path": {"type": "string"}}}
+            ),
+            (
+                "check_system_integrity", "Check system integrity (AIDE/Tripwire)", self.tool_check_system_integrity,
+                _EMPTY_SCHEMA
+            ),
+
+            # ===== KERNEL/CGROUPS (10 tools) =====
+            (
+                "get_kernel_version", "Get kernel version information", self.tool_get_kernel_version,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_kernel_modules", "List loaded kernel modules", self.tool_list_kernel_modules,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "load_kernel_module", "Load a kernel module", self.tool_load_kernel_module,
+                {"type": "object", "properties": {"module": {"type": "string"}, "params": {"type": "string"}}, "required": ["module"]}
+            ),
+            (
+                "unload_kernel_module", "Unload a kernel module", self.tool_unload_kernel_module,
+                {"type": "object", "properties": {"module": {"type": "string"}}, "required": ["module"]}
+            ),
+            (
+                "get_kernel_cmdline", "Get kernel command line", self.tool_get_kernel_cmdline,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_cgroups", "List cgroups hierarchy", self.tool_list_cgroups,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_cgroup_stats", "Get cgroup resource statistics", self.tool_get_cgroup_stats,
+                {"type": "object", "properties": {"cgroup": {"type": "string"}}, "required": ["cgroup"]}
+            ),
+            (
+                "get_cgroup_stats_batch", "Get cgroup resource statistics for several units at once", self.tool_get_cgroup_stats_batch,
+                {"type": "object", "properties": {"cgroups": {"type": "array", "items": {"type": "string"}}}, "required": ["cgroups"]}
+            ),
+            (
+                "set_cgroup_limit", "Set cgroup resource limit", self.tool_set_cgroup_limit,
+                {"type": "object", "properties": {"cgroup": {"type": "string"}, "resource": {"type": "string"}, "limit": {"type": "string"}}, "required": ["cgroup", "resource", "limit"]}
+            ),
+            (
+                "list_namespaces", "List Linux namespaces", self.tool_list_namespaces,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_capabilities", "Get process capabilities", self.tool_get_capabilities,
+                {"type": "object", "properties": {"pid": {"type": "integer"}}, "required": ["pid"]}
+            ),
+
+            # ===== MONITORING/LOGGING (10 tools) =====
+            (
+                "get_load_average", "Get system load average", self.tool_get_load_average,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_uptime", "Get system uptime", self.tool_get_uptime,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "list_zombie_processes", "List zombie processes", self.tool_list_zombie_processes,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "get_process_tree", "Get process tree", self.tool_get_process_tree,
+                {"type": "object", "properties": {"pid": {"type": "integer"}}}
+            ),
+            (
+                "strace_process", "Trace system calls of a process (strace)", self.tool_strace_process,
+                {"type": "object", "properties": {"pid": {"type": "integer"}, "duration": {"type": "integer"}}, "required": ["pid"]}
+            ),
+            (
+                "lsof_process", "List open files of a process", self.tool_lsof_process,
+                {"type": "object", "properties": {"pid": {"type": "integer"}}, "required": ["pid"]}
+            ),
+            (
+                "get_memory_map", "Get memory map of a process", self.tool_get_memory_map,
+                {"type": "object", "properties": {"pid": {"type": "integer"}}, "required": ["pid"]}
+            ),
+            (
+                "snapshot_processes", "Snapshot status, memory map and fd count for several pids at once", self.tool_snapshot_processes,
+                {"type": "object", "properties": {"pids": {"type": "array", "items": {"type": "integer"}}}, "required": ["pids"]}
+            ),
+            (
+                "monitor_realtime", "Start real-time monitoring (top-like)", self.tool_monitor_realtime,
+                {"type": "object", "properties": {"duration": {"type": "integer"}}}
+            ),
+            (
+                "analyze_logs", "Analyze system logs for errors", self.tool_analyze_logs,
+                {"type": "object", "properties": {"since": {"type": "string"}, "severity": {"type": "string"}}}
+            ),
+            (
+                "get_boot_messages", "Get boot messages (dmesg)", self.tool_get_boot_messages,
+                {"type": "object", "properties": {"level": {"type": "integer"}}}
+            ),
+            (
+                "clear_journal", "Clear systemd journal logs", self.tool_clear_journal,
+                _EMPTY_SCHEMA
+            ),
+            (
+                "set_file_permissions", "Set file permissions (chmod)", self.tool_set_file_permissions,
+                {"type": "object", "properties": {"path": {"type": "string"}, "mode": {"type": "string"}}, "required": ["path", "mode"]}
+            ),
+            (
+                "set_selinux_mode", "Set SELinux enforcement mode", self.tool_set_selinux_mode,
+                {"type": "object", "properties": {"mode": {"type": "string", "enum": ["enforcing", "permissive", "disabled"]}}, "required": ["mode"]}
+            ),
+            (
+                "set_apparmor_mode", "Set AppArmor profile mode", self.tool_set_apparmor_mode,
+                {"type": "object", "properties": {"mode": {"type": "string", "enum": ["enforce", "complain", "disable"]}, "profile": {"type": "string"}}, "required": ["mode"]}
+            ),
         
-        # ===== DESTRUCTIVE OPERATIONS (5 tools) =====
-        handler.register_tool(
-            "start_service", "Start a systemd service", self.tool_start_service,
-            {"type": "object", "properties": {"service": {"type": "string"}}, "required": ["service"]}
-        )
-        handler.register_tool(
-            "stop_service", "Stop a systemd service", self.tool_stop_service,
-            {"type": "object", "properties": {"service": {"type": "string"}}, "required": ["service"]}
-        )
-        handler.register_tool(
-            "restart_service", "Restart a systemd service", self.tool_restart_service,
-            {"type": "object", "properties": {"service": {"type": "string"}}, "required": ["service"]}
-        )
-        handler.register_tool(
-            "reload_service", "Reload a systemd service configuration", self.tool_reload_service,
-            {"type": "object", "properties": {"service": {"type": "string"}}, "required": ["service"]}
-        )
-        handler.register_tool(
-            "reboot_system", "Reboot the system", self.tool_reboot_system,
-            {"type": "object", "properties": {"delay": {"type": "integer", "description": "Delay in seconds before reboot"}}}
-        )
+            # ===== DESTRUCTIVE OPERATIONS =====
+            (
+                "manage_unit", "Start, stop, restart or reload a systemd unit", self.tool_manage_unit,
+                {"type": "object", "properties": {"action": {"type": "string", "enum": ["start", "stop", "restart", "reload"]}, "unit": {"type": "string"}}, "required": ["action", "unit"]}
+            ),
+            (
+                "systemctl_batch", "Apply one systemctl action to many units in a single call", self.tool_systemctl_batch,
+                {"type": "object", "properties": {"action": {"type": "string", "enum": ["start", "stop", "restart", "reload"]}, "units": {"type": "array", "items": {"type": "string"}}}, "required": ["action", "units"]}
+            ),
+            (
+                "reboot_system", "Reboot the system", self.tool_reboot_system,
+                {"type": "object", "properties": {"delay": {"type": "integer", "description": "Delay in seconds before reboot"}}}
+            ),
+        ]
+        handler.register_batch(specs)
 
     # ==================== SYSTEMD IMPLEMENTATIONS ====================
     
@@ -485,49 +1090,38 @@ class ExtendedMCPTools:
         cmd = ["systemctl", "list-units", "--all", "--no-pager"]
         if type:
             cmd.append(f"--type={type}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        # Parse output and return structured data
-        return [{"raw": result.stdout}]
+        return await _list_units_json(cmd)
 
     @require_permission("tool_get_unit_properties", Permission.READ_ONLY)
     async def tool_get_unit_properties(self, unit: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "show", unit, "--no-pager"], capture_output=True, text=True)
-        props = {}
-        for line in result.stdout.split("\n"):
-            if "=" in line:
-                k, v = line.split("=", 1)
-                props[k] = v
-        return props
+        result = await _run(["systemctl", "show", unit, "--no-pager"])
+        return dict(_SHOW_PROP.findall(result.stdout))
 
     @require_permission("tool_enable_unit", Permission.AI_ASK)
     @permission_audit("tool_enable_unit")
     async def tool_enable_unit(self, unit: str, now: bool = False) -> Dict[str, Any]:
-        cmd = ["systemctl", "enable", unit]
-        if now:
-            cmd.append("--now")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error", "output": result.stdout}
+        cmd = [*_SYSTEMCTL_ENABLE, unit, *(("--now",) if now else ())]
+        result = await _run(cmd)
+        return {"status": _status_of(result), "output": result.stdout}
 
     @require_permission("tool_disable_unit", Permission.AI_ASK)
     @permission_audit("tool_disable_unit")
     async def tool_disable_unit(self, unit: str, now: bool = False) -> Dict[str, Any]:
-        cmd = ["systemctl", "disable", unit]
-        if now:
-            cmd.append("--now")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error", "output": result.stdout}
+        cmd = [*_SYSTEMCTL_DISABLE, unit, *(("--now",) if now else ())]
+        result = await _run(cmd)
+        return {"status": _status_of(result), "output": result.stdout}
 
     @require_permission("tool_mask_unit", Permission.AI_ASK)
     @permission_audit("tool_mask_unit")
     async def tool_mask_unit(self, unit: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "mask", unit], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run([*_SYSTEMCTL_MASK, unit])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_unmask_unit", Permission.AI_ASK)
     @permission_audit("tool_unmask_unit")
     async def tool_unmask_unit(self, unit: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "unmask", unit], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run([*_SYSTEMCTL_UNMASK, unit])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_reload_systemd", Permission.AI_AUTO)
     @permission_audit("tool_reload_systemd")
@@ -545,9 +1139,9 @@ class ExtendedMCPTools:
         except Exception as e:
             # Fallback to systemctl if native implementation fails
             try:
-                result = subprocess.run(["systemctl", "daemon-reload"], capture_output=True, text=True, timeout=10)
+                result = await _run(["systemctl", "daemon-reload"], timeout=10)
                 return {
-                    "status": "ok" if result.returncode == 0 else "error",
+                    "status": _status_of(result),
                     "message": result.stdout if result.returncode == 0 else result.stderr,
                     "implementation": "systemctl-fallback"
                 }
@@ -560,30 +1154,40 @@ class ExtendedMCPTools:
 
     @require_permission("tool_list_timers", Permission.READ_ONLY)
     async def tool_list_timers(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["systemctl", "list-timers", "--all", "--no-pager"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        result = await _run(["systemctl", "list-timers", "--all", "--no-pager", "--output=json"],
+                            text=False)
+        if result.returncode != 0 or not result.stdout:
+            # Older systemd without --output=json support exits non-zero
+            # with empty stdout
+            result = await _run(["systemctl", "list-timers", "--all", "--no-pager"], text=False)
+            return [{"raw": result.stdout.decode(errors="replace")}]
+        try:
+            return _loads(result.stdout)
+        except (ValueError, json.JSONDecodeError):
+            return [{"raw": result.stdout.decode(errors="replace")}]
 
     @require_permission("tool_show_unit_dependencies", Permission.READ_ONLY)
     async def tool_show_unit_dependencies(self, unit: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "list-dependencies", unit, "--no-pager"], capture_output=True, text=True)
-        return {"dependencies": result.stdout}
+        result = await _run(["systemctl", "list-dependencies", unit, "--no-pager", "--plain"])
+        deps = [line.strip() for line in result.stdout.splitlines()[1:] if line.strip()]
+        return {"unit": unit, "dependencies": deps}
 
     @require_permission("tool_isolate_target", Permission.AI_ASK)
     @permission_audit("tool_isolate_target")
     async def tool_isolate_target(self, target: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "isolate", target], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run([*_SYSTEMCTL_ISOLATE, target])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_set_default_target", Permission.AI_ASK)
     @permission_audit("tool_set_default_target")
     async def tool_set_default_target(self, target: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "set-default", target], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run([*_SYSTEMCTL_SET_DEFAULT, target])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_get_failed_units", Permission.READ_ONLY)
     async def tool_get_failed_units(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["systemctl", "list-units", "--failed", "--no-pager"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        units = await self._snapshot_units()
+        return [u for u in units if u.get("active") == "failed"]
 
     @require_permission("tool_reset_failed_units", Permission.AI_AUTO)
     @permission_audit("tool_reset_failed_units")
@@ -604,9 +1208,9 @@ class ExtendedMCPTools:
                 cmd = ["systemctl", "reset-failed"]
                 if unit:
                     cmd.append(unit)
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                result = await _run(cmd, timeout=10)
                 return {
-                    "status": "ok" if result.returncode == 0 else "error",
+                    "status": _status_of(result),
                     "message": result.stdout if result.returncode == 0 else result.stderr,
                     "implementation": "systemctl-fallback"
                 }
@@ -619,18 +1223,19 @@ class ExtendedMCPTools:
 
     @require_permission("tool_list_sockets", Permission.READ_ONLY)
     async def tool_list_sockets(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["systemctl", "list-sockets", "--all", "--no-pager"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        units = await self._snapshot_units()
+        return [u for u in units if str(u.get("unit", "")).endswith(".socket")]
 
     @require_permission("tool_list_mounts", Permission.READ_ONLY)
     async def tool_list_mounts(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["systemctl", "list-units", "--type=mount", "--no-pager"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        units = await self._snapshot_units()
+        return [u for u in units if str(u.get("unit", "")).endswith(".mount")]
 
     @require_permission("tool_analyze_security", Permission.READ_ONLY)
+    @_heavy
     async def tool_analyze_security(self, unit: str) -> Dict[str, Any]:
         try:
-            result = subprocess.run(["systemd-analyze", "security", unit], capture_output=True, text=True, timeout=10)
+            result = await _run(["systemd-analyze", "security", unit], timeout=10)
             if result.returncode != 0:
                 return {"error": f"systemd-analyze security failed: {result.stderr}", "analysis": None}
             return {"analysis": result.stdout}
@@ -642,16 +1247,16 @@ class ExtendedMCPTools:
             return {"error": str(e), "analysis": None}
 
     @require_permission("tool_analyze_blame", Permission.READ_ONLY)
+    @_heavy
     async def tool_analyze_blame(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["systemd-analyze", "blame"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        return [{"raw": await _run_tail(["systemd-analyze", "blame"])}]
 
     @require_permission("tool_analyze_critical_chain", Permission.READ_ONLY)
     async def tool_analyze_critical_chain(self, unit: str = None) -> Dict[str, Any]:
         cmd = ["systemd-analyze", "critical-chain"]
         if unit:
             cmd.append(unit)
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await _run(cmd)
         return {"chain": result.stdout}
 
     @require_permission("tool_edit_unit", Permission.DISABLED)
@@ -660,60 +1265,153 @@ class ExtendedMCPTools:
         return {"error": "Not implemented - use systemctl edit with caution"}
 
     @require_permission("tool_cat_unit", Permission.READ_ONLY)
-    async def tool_cat_unit(self, unit: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "cat", unit], capture_output=True, text=True)
-        return {"content": result.stdout}
+    async def tool_cat_unit(self, unit: str, max_bytes: int = 65536) -> Dict[str, Any]:
+        return {"content": await _run_tail(["systemctl", "cat", unit], tail_bytes=max_bytes)}
 
     # ==================== NETWORK IMPLEMENTATIONS ====================
 
     @require_permission("tool_list_interfaces", Permission.READ_ONLY)
+    @ttl_cache(5.0)
     async def tool_list_interfaces(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["ip", "link", "show"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        # /proc/net/dev already has per-interface counters; no need to fork ip
+        try:
+            with open("/proc/net/dev", "r") as f:
+                lines = f.read().splitlines()[2:]  # skip the two header lines
+            interfaces = []
+            for line in lines:
+                name, _, stats = line.partition(":")
+                fields = stats.split()
+                interfaces.append({
+                    "interface": name.strip(),
+                    "rx_bytes": int(fields[0]),
+                    "rx_packets": int(fields[1]),
+                    "tx_bytes": int(fields[8]),
+                    "tx_packets": int(fields[9]),
+                })
+            return interfaces
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_get_interface_status", Permission.READ_ONLY)
     async def tool_get_interface_status(self, interface: str) -> Dict[str, Any]:
-        result = subprocess.run(["ip", "addr", "show", interface], capture_output=True, text=True)
+        result = await _run(["ip", "addr", "show", interface])
         return {"status": result.stdout}
 
+    async def _link_set(self, interface: str, state: str) -> Dict[str, Any]:
+        """Flip link state via one netlink message when pyroute2 is present."""
+        if IPRoute is not None:
+            def _set():
+                with IPRoute() as ipr:
+                    idx = ipr.link_lookup(ifname=interface)
+                    if not idx:
+                        raise ValueError(f"No such interface: {interface}")
+                    ipr.link("set", index=idx[0], state=state)
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, _set)
+                return {"status": _OK}
+            except Exception as e:
+                return {"status": _ERROR, "error": str(e)}
+        result = await _run(["ip", "link", "set", interface, state])
+        return {"status": _status_of(result)}
+
     @require_permission("tool_set_interface_up", Permission.AI_ASK)
     @permission_audit("tool_set_interface_up")
     async def tool_set_interface_up(self, interface: str) -> Dict[str, Any]:
-        result = subprocess.run(["ip", "link", "set", interface, "up"], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        return await self._link_set(interface, "up")
 
     @require_permission("tool_set_interface_down", Permission.AI_ASK)
     @permission_audit("tool_set_interface_down")
     async def tool_set_interface_down(self, interface: str) -> Dict[str, Any]:
-        result = subprocess.run(["ip", "link", "set", interface, "down"], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        return await self._link_set(interface, "down")
 
     @require_permission("tool_list_routes", Permission.READ_ONLY)
+    @ttl_cache(5.0)
     async def tool_list_routes(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["ip", "route", "show"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        try:
+            with open("/proc/net/route", "r") as f:
+                lines = f.read().splitlines()[1:]
+            routes = []
+            for line in lines:
+                parts = line.split()
+                if len(parts) < 8:
+                    continue
+                routes.append({
+                    "interface": parts[0],
+                    "destination": _decode_hex_ipv4(parts[1]),
+                    "gateway": _decode_hex_ipv4(parts[2]),
+                    "mask": _decode_hex_ipv4(parts[7]),
+                    "metric": int(parts[6]),
+                })
+            return routes
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_add_route", Permission.AI_ASK)
     @permission_audit("tool_add_route")
     async def tool_add_route(self, destination: str, gateway: str = None, device: str = None) -> Dict[str, Any]:
+        if IPRoute is not None:
+            def _add():
+                with IPRoute() as ipr:
+                    kwargs = {"dst": destination}
+                    if gateway:
+                        kwargs["gateway"] = gateway
+                    if device:
+                        idx = ipr.link_lookup(ifname=device)
+                        if not idx:
+                            raise ValueError(f"No such interface: {device}")
+                        kwargs["oif"] = idx[0]
+                    ipr.route("add", **kwargs)
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, _add)
+                return {"status": _OK}
+            except Exception as e:
+                return {"status": _ERROR, "error": str(e)}
         cmd = ["ip", "route", "add", destination]
         if gateway:
             cmd.extend(["via", gateway])
         if device:
             cmd.extend(["dev", device])
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(cmd)
+        return {"status": _status_of(result)}
 
     @require_permission("tool_del_route", Permission.AI_ASK)
     @permission_audit("tool_del_route")
     async def tool_del_route(self, destination: str) -> Dict[str, Any]:
-        result = subprocess.run(["ip", "route", "del", destination], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        if IPRoute is not None:
+            def _del():
+                with IPRoute() as ipr:
+                    ipr.route("del", dst=destination)
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, _del)
+                return {"status": _OK}
+            except Exception as e:
+                return {"status": _ERROR, "error": str(e)}
+        result = await _run(["ip", "route", "del", destination])
+        return {"status": _status_of(result)}
+
+    @cached_property
+    def _nft(self):
+        """Lazy libnftables handle configured for JSON output, or None."""
+        if _nftables is None:
+            return None
+        nft = _nftables.Nftables()
+        nft.set_json_output(True)
+        return nft
 
     @require_permission("tool_list_firewall_rules", Permission.READ_ONLY)
     async def tool_list_firewall_rules(self, table: str = "filter") -> List[Dict[str, Any]]:
+        if self._nft is not None:
+            def _dump():
+                return self._nft.cmd(f"list table ip {table}")
+            try:
+                rc, output, error = await asyncio.get_running_loop().run_in_executor(None, _dump)
+                if rc != 0:
+                    return [{"error": f"nftables failed: {error}", "raw": None}]
+                return json.loads(output).get("nftables", [])
+            except Exception as e:
+                return [{"error": str(e), "raw": None}]
         try:
-            result = subprocess.run(["iptables", "-t", table, "-L", "-n", "-v"], capture_output=True, text=True, timeout=5)
+            result = await _run(["iptables", "-t", table, "-L", "-n", "-v"], timeout=5)
             if result.returncode != 0:
                 return [{"error": f"iptables failed: {result.stderr}", "raw": None}]
             return [{"raw": result.stdout}]
@@ -731,14 +1429,17 @@ class ExtendedMCPTools:
     @require_permission("tool_del_firewall_rule", Permission.AI_ASK)
     @permission_audit("tool_del_firewall_rule")
     async def tool_del_firewall_rule(self, chain: str, rule_num: int) -> Dict[str, Any]:
-        result = subprocess.run(["iptables", "-D", chain, str(rule_num)], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(["iptables", "-D", chain, str(rule_num)])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_get_dns_config", Permission.READ_ONLY)
+    @ttl_cache(30.0)
     async def tool_get_dns_config(self) -> Dict[str, Any]:
         try:
-            with open("/etc/resolv.conf", "r") as f:
-                return {"config": f.read()}
+            data = _batched_read(["/etc/resolv.conf"])
+            if "/etc/resolv.conf" not in data:
+                return {"error": "/etc/resolv.conf not readable"}
+            return {"config": data["/etc/resolv.conf"].decode(errors="replace")}
         except Exception as e:
             return {"error": str(e)}
 
@@ -752,21 +1453,33 @@ class ExtendedMCPTools:
     async def tool_ping_host(self, host: str, count: int = 4) -> Dict[str, Any]:
         """
         Ping host for connectivity test.
-        Uses shorter timeout and smaller count for faster response.
+        Sends ICMP echoes on a shared async socket; falls back to the ping
+        binary when unprivileged ICMP sockets are disabled on this host.
         """
+        actual_count = min(count, 3)  # Max 3 pings
+        timeout_per_ping = 2  # 2 seconds per ping
+        try:
+            rtts = []
+            for _ in range(actual_count):
+                rtt = await _PINGER.ping(host, timeout=timeout_per_ping)
+                if rtt is not None:
+                    rtts.append(round(rtt, 2))
+            return {
+                "host": host,
+                "transmitted": actual_count,
+                "received": len(rtts),
+                "rtt_ms": rtts,
+                "avg_rtt_ms": round(sum(rtts) / len(rtts), 2) if rtts else None,
+                "success": bool(rtts),
+            }
+        except socket.gaierror as e:
+            return {"error": f"Cannot resolve {host}: {e}", "output": None}
+        except (PermissionError, OSError):
+            # net.ipv4.ping_group_range excludes us; fork ping instead
+            pass
         try:
-            # Reduce count and timeout for faster response
-            actual_count = min(count, 3)  # Max 3 pings
-            timeout_per_ping = 2  # 2 seconds per ping
             total_timeout = actual_count * timeout_per_ping + 2  # Extra 2 seconds buffer
-            
-            result = subprocess.run(
-                ["ping", "-c", str(actual_count), "-W", str(timeout_per_ping), host],
-                capture_output=True,
-                text=True,
-                timeout=total_timeout
-            )
-            
+            result = await _run(["ping", "-c", str(actual_count), "-W", str(timeout_per_ping), host], timeout=total_timeout)
             return {
                 "output": result.stdout,
                 "success": result.returncode == 0,
@@ -785,10 +1498,11 @@ class ExtendedMCPTools:
             return {"error": str(e), "output": None}
 
     @require_permission("tool_traceroute", Permission.READ_ONLY)
+    @_heavy
     async def tool_traceroute(self, host: str) -> Dict[str, Any]:
         """Trace route to host (requires traceroute package)"""
         try:
-            result = subprocess.run(["traceroute", host], capture_output=True, text=True, timeout=60)
+            result = await _run(["traceroute", host], timeout=60)
             return {"output": result.stdout, "success": result.returncode == 0, "available": True}
         except FileNotFoundError:
             return {
@@ -804,35 +1518,59 @@ class ExtendedMCPTools:
 
     @require_permission("tool_netstat", Permission.READ_ONLY)
     async def tool_netstat(self, tcp: bool = True, udp: bool = True, listening: bool = False) -> List[Dict[str, Any]]:
-        cmd = ["ss", "-n"]
-        if tcp:
-            cmd.append("-t")
-        if udp:
-            cmd.append("-u")
-        if listening:
-            cmd.append("-l")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        try:
+            return _query_sockets(tcp, udp, listening)
+        except Exception as e:
+            return [{"error": str(e)}]
 
     # ==================== STORAGE IMPLEMENTATIONS ====================
 
     @require_permission("tool_list_block_devices", Permission.READ_ONLY)
+    @ttl_cache(5.0)
     async def tool_list_block_devices(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["lsblk", "-J"], capture_output=True, text=True)
+        result = await _run(["lsblk", "-J"], text=False)
         try:
-            return [json.loads(result.stdout)]
-        except:
-            return [{"raw": result.stdout}]
+            return [_loads(result.stdout)]
+        except Exception:
+            return [{"raw": result.stdout.decode(errors="replace")}]
 
     @require_permission("tool_get_disk_usage", Permission.READ_ONLY)
     async def tool_get_disk_usage(self, path: str = "/") -> Dict[str, Any]:
-        result = subprocess.run(["df", "-h", path], capture_output=True, text=True)
-        return {"output": result.stdout}
+        # One statvfs syscall instead of forking df
+        try:
+            s = os.statvfs(path)
+            total = s.f_blocks * s.f_frsize
+            free = s.f_bavail * s.f_frsize
+            used = (s.f_blocks - s.f_bfree) * s.f_frsize
+            return {
+                "path": path,
+                "total_bytes": total,
+                "used_bytes": used,
+                "free_bytes": free,
+                "used_percent": round(used * 100 / (used + free), 1) if used + free else 0.0,
+            }
+        except Exception as e:
+            return {"error": str(e)}
 
     @require_permission("tool_list_mounted_filesystems", Permission.READ_ONLY)
     async def tool_list_mounted_filesystems(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["mount"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        # The mount binary just reads /proc/self/mounts; do the same
+        try:
+            data = _batched_read(["/proc/self/mounts"]).get("/proc/self/mounts", b"")
+            mounts = []
+            for line in data.decode(errors="replace").splitlines():
+                parts = line.split()
+                if len(parts) < 4:
+                    continue
+                mounts.append({
+                    "device": parts[0],
+                    "mountpoint": parts[1],
+                    "fstype": parts[2],
+                    "options": parts[3],
+                })
+            return mounts
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_mount_filesystem", Permission.AI_ASK)
     @permission_audit("tool_mount_filesystem")
@@ -843,25 +1581,26 @@ class ExtendedMCPTools:
         if options:
             cmd.extend(["-o", options])
         cmd.extend([device, mountpoint])
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error", "output": result.stderr}
+        result = await _run(cmd)
+        return {"status": _status_of(result), "output": result.stderr}
 
     @require_permission("tool_unmount_filesystem", Permission.AI_ASK)
     @permission_audit("tool_unmount_filesystem")
     async def tool_unmount_filesystem(self, mountpoint: str) -> Dict[str, Any]:
-        result = subprocess.run(["umount", mountpoint], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(["umount", mountpoint])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_list_lvm_volumes", Permission.READ_ONLY)
     async def tool_list_lvm_volumes(self) -> List[Dict[str, Any]]:
         try:
-            result = subprocess.run(["lvs", "--reportformat", "json"], capture_output=True, text=True, timeout=5)
+            result = await _run(["lvs", "--reportformat", "json"], timeout=5, text=False)
             if result.returncode != 0:
-                return [{"error": f"lvs failed: {result.stderr}", "volumes": None}]
+                return [{"error": f"lvs failed: {result.stderr.decode(errors='replace')}",
+                         "volumes": None}]
             try:
-                return [json.loads(result.stdout)]
-            except json.JSONDecodeError:
-                return [{"raw": result.stdout}]
+                return [_loads(result.stdout)]
+            except (ValueError, json.JSONDecodeError):
+                return [{"raw": result.stdout.decode(errors="replace")}]
         except FileNotFoundError:
             return [{"error": "lvs command not found - install lvm2 package", "volumes": None}]
         except Exception as e:
@@ -870,55 +1609,131 @@ class ExtendedMCPTools:
     @require_permission("tool_create_lvm_volume", Permission.AI_ASK)
     @permission_audit("tool_create_lvm_volume")
     async def tool_create_lvm_volume(self, vg: str, name: str, size: str) -> Dict[str, Any]:
-        result = subprocess.run(["lvcreate", "-L", size, "-n", name, vg], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(["lvcreate", "-L", size, "-n", name, vg])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_extend_lvm_volume", Permission.AI_ASK)
     @permission_audit("tool_extend_lvm_volume")
     async def tool_extend_lvm_volume(self, lv_path: str, size: str) -> Dict[str, Any]:
-        result = subprocess.run(["lvextend", "-L", size, lv_path], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(["lvextend", "-L", size, lv_path])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_check_filesystem", Permission.READ_ONLY)
+    @_heavy
     async def tool_check_filesystem(self, device: str) -> Dict[str, Any]:
-        result = subprocess.run(["fsck", "-n", device], capture_output=True, text=True)
+        result = await _run(["fsck", "-n", device])
         return {"output": result.stdout}
 
     @require_permission("tool_list_raid_arrays", Permission.READ_ONLY)
     async def tool_list_raid_arrays(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["cat", "/proc/mdstat"], capture_output=True, text=True)
-        return [{"mdstat": result.stdout}]
+        try:
+            data = _batched_read(["/proc/mdstat"])
+            if "/proc/mdstat" not in data:
+                return [{"mdstat": "", "info": "md driver not loaded"}]
+            return [{"mdstat": data["/proc/mdstat"].decode(errors="replace")}]
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_get_smart_status", Permission.READ_ONLY)
+    @_heavy
     async def tool_get_smart_status(self, device: str) -> Dict[str, Any]:
-        result = subprocess.run(["smartctl", "-a", device], capture_output=True, text=True)
-        return {"smart": result.stdout}
+        return {"smart": await _run_tail(["smartctl", "-a", device])}
 
     @require_permission("tool_list_inodes", Permission.READ_ONLY)
     async def tool_list_inodes(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["df", "-i"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        try:
+            rows = []
+            seen = set()
+            with open("/proc/self/mounts", "r") as f:
+                for line in f:
+                    device, mountpoint, _fstype = line.split()[:3]
+                    if mountpoint in seen:
+                        continue
+                    seen.add(mountpoint)
+                    try:
+                        s = os.statvfs(mountpoint)
+                    except OSError:
+                        continue
+                    if s.f_files == 0:  # pseudo filesystems have no inode table
+                        continue
+                    rows.append({
+                        "filesystem": device,
+                        "mountpoint": mountpoint,
+                        "inodes": s.f_files,
+                        "used": s.f_files - s.f_ffree,
+                        "free": s.f_ffree,
+                    })
+            return rows
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_find_large_files", Permission.READ_ONLY)
-    async def tool_find_large_files(self, path: str, limit: int = 10) -> List[Dict[str, Any]]:
-        result = subprocess.run(["du", "-ah", path, "--max-depth=3"], capture_output=True, text=True, timeout=60)
-        lines = result.stdout.split("\n")
-        # Sort and return top N
-        return [{"files": "\n".join(lines[:limit])}]
+    @_heavy
+    async def tool_find_large_files(self, path: str, limit: int = 10, max_depth: int = 3) -> List[Dict[str, Any]]:
+        # The old du pipeline returned the first N lines du printed, not the
+        # largest files. Walk with os.scandir (one syscall per entry) and keep
+        # only the top N sizes in a heap; the tree walk runs in a worker
+        # thread so the event loop stays free.
+        def walk(root: str, depth: int):
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                yield entry.stat(follow_symlinks=False).st_size, entry.path
+                            elif entry.is_dir(follow_symlinks=False) and depth < max_depth:
+                                yield from walk(entry.path, depth + 1)
+                        except OSError:
+                            continue
+            except OSError:
+                return
+
+        try:
+            loop = asyncio.get_running_loop()
+            largest = await loop.run_in_executor(None, lambda: heapq.nlargest(limit, walk(path, 0)))
+            return [{"path": p, "size_bytes": size} for size, p in largest]
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_get_disk_io_stats", Permission.READ_ONLY)
     async def tool_get_disk_io_stats(self) -> Dict[str, Any]:
+        # Two /proc/diskstats snapshots with an async sleep between them;
+        # iostat does exactly this but blocked the loop for its sampling
+        # window and needed the sysstat package.
+        def snapshot() -> Dict[str, List[int]]:
+            stats = {}
+            with open("/proc/diskstats", "r") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) < 14:
+                        continue
+                    stats[parts[2]] = [int(x) for x in parts[3:14]]
+            return stats
+
         try:
-            result = subprocess.run(["iostat", "-x", "1", "2"], capture_output=True, text=True, timeout=10)
-            if result.returncode != 0:
-                return {"error": f"iostat failed: {result.stderr}", "iostat": None}
-            return {"iostat": result.stdout}
-        except FileNotFoundError:
-            return {"error": "iostat command not found - install sysstat package", "iostat": None}
-        except subprocess.TimeoutExpired:
-            return {"error": "iostat timed out", "iostat": None}
+            interval = 1.0
+            before = snapshot()
+            await asyncio.sleep(interval)
+            after = snapshot()
+            devices = {}
+            for name, cur in after.items():
+                prev = before.get(name)
+                if prev is None:
+                    continue
+                reads = cur[0] - prev[0]
+                writes = cur[4] - prev[4]
+                ios = reads + writes
+                devices[name] = {
+                    "reads_per_sec": reads / interval,
+                    "writes_per_sec": writes / interval,
+                    "read_bytes_per_sec": (cur[2] - prev[2]) * 512 / interval,
+                    "write_bytes_per_sec": (cur[6] - prev[6]) * 512 / interval,
+                    "io_in_progress": cur[8],
+                    "avg_wait_ms": (cur[10] - prev[10]) / ios if ios else 0.0,
+                }
+            return {"interval_seconds": interval, "devices": devices}
         except Exception as e:
-            return {"error": str(e), "iostat": None}
+            return {"error": str(e)}
 
     @require_permission("tool_tune_filesystem", Permission.AI_ASK)
     @permission_audit("tool_tune_filesystem")
@@ -930,25 +1745,36 @@ class ExtendedMCPTools:
 
     @require_permission("tool_list_installed_packages", Permission.READ_ONLY)
     async def tool_list_installed_packages(self, pattern: str = None) -> List[Dict[str, Any]]:
-        # Detect package manager
-        if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-            cmd = ["dpkg", "-l"]
-            if pattern:
-                cmd.append(pattern)
-        elif subprocess.run(["which", "yum"], capture_output=True).returncode == 0:
-            cmd = ["rpm", "-qa"]
+        if self.pkg_mgr == "apt":
+            result = await _run(["dpkg", "-l"])
+            packages = [
+                {"name": m[1], "version": m[2], "arch": m[3], "description": m[4]}
+                for m in _DPKG_INSTALLED.finditer(result.stdout)
+            ]
+        elif self.pkg_mgr in ("dnf", "yum"):
+            result = await _run(
+                ["rpm", "-qa", "--qf", "%{NAME}\t%{VERSION}-%{RELEASE}\t%{ARCH}\n"])
+            packages = []
+            for line in result.stdout.splitlines():
+                fields = line.split("\t")
+                if len(fields) == 3:
+                    packages.append(
+                        {"name": fields[0], "version": fields[1], "arch": fields[2]})
         else:
             return [{"error": "Unknown package manager"}]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+
+        if pattern:
+            # Filter client-side so a new pattern never re-spawns the tool
+            matcher = re.compile(fnmatch.translate(pattern)).match
+            packages = [p for p in packages if matcher(p["name"])]
+        return packages
 
     @require_permission("tool_search_packages", Permission.READ_ONLY)
     async def tool_search_packages(self, query: str) -> List[Dict[str, Any]]:
-        if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-            result = subprocess.run(["apt", "search", query], capture_output=True, text=True)
-        elif subprocess.run(["which", "yum"], capture_output=True).returncode == 0:
-            result = subprocess.run(["yum", "search", query], capture_output=True, text=True)
+        if self.pkg_mgr == "apt":
+            result = await _run(["apt", "search", query])
+        elif self.pkg_mgr in ("dnf", "yum"):
+            result = await _run([self.pkg_mgr, "search", query])
         else:
             return [{"error": "Unknown package manager"}]
         return [{"raw": result.stdout}]
@@ -967,13 +1793,13 @@ class ExtendedMCPTools:
     @require_permission("tool_update_package_cache", Permission.AI_ASK)
     @permission_audit("tool_update_package_cache")
     async def tool_update_package_cache(self) -> Dict[str, Any]:
-        if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-            result = subprocess.run(["apt", "update"], capture_output=True, text=True)
-        elif subprocess.run(["which", "yum"], capture_output=True).returncode == 0:
-            result = subprocess.run(["yum", "check-update"], capture_output=True, text=True)
+        if self.pkg_mgr == "apt":
+            result = await _run(["apt", "update"])
+        elif self.pkg_mgr in ("dnf", "yum"):
+            result = await _run([self.pkg_mgr, "check-update"])
         else:
             return {"error": "Unknown package manager"}
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        return {"status": _status_of(result)}
 
     @require_permission("tool_upgrade_system", Permission.AI_ASK)
     @permission_audit("tool_upgrade_system")
@@ -982,18 +1808,18 @@ class ExtendedMCPTools:
 
     @require_permission("tool_list_upgradable", Permission.READ_ONLY)
     async def tool_list_upgradable(self) -> List[Dict[str, Any]]:
-        if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-            result = subprocess.run(["apt", "list", "--upgradable"], capture_output=True, text=True)
+        if self.pkg_mgr == "apt":
+            result = await _run(["apt", "list", "--upgradable"])
         else:
             return [{"error": "Not implemented for this package manager"}]
         return [{"raw": result.stdout}]
 
     @require_permission("tool_get_package_info", Permission.READ_ONLY)
     async def tool_get_package_info(self, package: str) -> Dict[str, Any]:
-        if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-            result = subprocess.run(["apt", "show", package], capture_output=True, text=True)
-        elif subprocess.run(["which", "yum"], capture_output=True).returncode == 0:
-            result = subprocess.run(["yum", "info", package], capture_output=True, text=True)
+        if self.pkg_mgr == "apt":
+            result = await _run(["apt", "show", package])
+        elif self.pkg_mgr in ("dnf", "yum"):
+            result = await _run([self.pkg_mgr, "info", package])
         else:
             return {"error": "Unknown package manager"}
         return {"info": result.stdout}
@@ -1006,10 +1832,10 @@ class ExtendedMCPTools:
     @require_permission("tool_clean_package_cache", Permission.AI_ASK)
     @permission_audit("tool_clean_package_cache")
     async def tool_clean_package_cache(self) -> Dict[str, Any]:
-        if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-            result = subprocess.run(["apt", "clean"], capture_output=True, text=True)
-        elif subprocess.run(["which", "yum"], capture_output=True).returncode == 0:
-            result = subprocess.run(["yum", "clean", "all"], capture_output=True, text=True)
+        if self.pkg_mgr == "apt":
+            result = await _run(["apt", "clean"])
+        elif self.pkg_mgr in ("dnf", "yum"):
+            result = await _run([self.pkg_mgr, "clean", "all"])
         else:
             return {"error": "Unknown package manager"}
         return {"status": "ok"}
@@ -1019,16 +1845,21 @@ class ExtendedMCPTools:
     @require_permission("tool_list_users", Permission.READ_ONLY)
     async def tool_list_users(self) -> List[Dict[str, Any]]:
         try:
-            with open("/etc/passwd", "r") as f:
-                return [{"users": f.read()}]
+            return _nss_cached("/etc/passwd", lambda: [
+                {"name": p.pw_name, "uid": p.pw_uid, "gid": p.pw_gid,
+                 "home": p.pw_dir, "shell": p.pw_shell}
+                for p in pwd.getpwall()
+            ])
         except Exception as e:
             return [{"error": str(e)}]
 
     @require_permission("tool_list_groups", Permission.READ_ONLY)
     async def tool_list_groups(self) -> List[Dict[str, Any]]:
         try:
-            with open("/etc/group", "r") as f:
-                return [{"groups": f.read()}]
+            return _nss_cached("/etc/group", lambda: [
+                {"name": g.gr_name, "gid": g.gr_gid, "members": list(g.gr_mem)}
+                for g in grp.getgrall()
+            ])
         except Exception as e:
             return [{"error": str(e)}]
 
@@ -1037,8 +1868,6 @@ class ExtendedMCPTools:
     async def tool_create_user(self, username: str, home: str = None, shell: str = None, groups: List[str] = None) -> Dict[str, Any]:
         return {"error": "User creation requires confirmation"}
 
-    @require_permission("tool_delete_user", Permission.AI_ASK)
-    @permission_audit("tool_delete_user")
     @require_permission("tool_delete_user", Permission.AI_ASK)
     @permission_audit("tool_delete_user")
     async def tool_delete_user(self, username: str, remove_home: bool = False) -> Dict[str, Any]:
@@ -1048,7 +1877,7 @@ class ExtendedMCPTools:
             if remove_home:
                 cmd.append("-r")
             cmd.append(username)
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=True)
+            result = await _run(cmd, timeout=10, check=True)
             return {"status": "ok", "username": username, "removed_home": remove_home}
         except subprocess.CalledProcessError as e:
             return {"error": f"Failed to delete user: {e.stderr}"}
@@ -1070,7 +1899,7 @@ class ExtendedMCPTools:
             if comment:
                 cmd.extend(["-c", comment])
             cmd.append(username)
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=True)
+            result = await _run(cmd, timeout=10, check=True)
             return {"status": "ok", "username": username, "output": result.stdout}
         except subprocess.CalledProcessError as e:
             return {"error": f"Failed to modify user: {e.stderr}"}
@@ -1088,30 +1917,65 @@ class ExtendedMCPTools:
     @require_permission("tool_add_user_to_group", Permission.AI_ASK)
     @permission_audit("tool_add_user_to_group")
     async def tool_add_user_to_group(self, username: str, groupname: str) -> Dict[str, Any]:
-        result = subprocess.run(["usermod", "-aG", groupname, username], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(["usermod", "-aG", groupname, username])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_list_logged_in_users", Permission.READ_ONLY)
+    @ttl_cache(5.0)
     async def tool_list_logged_in_users(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["who"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        try:
+            return [
+                {"user": r["user"], "line": r["line"], "host": r["host"], "login_time": r["time"]}
+                for r in _read_utmp("/var/run/utmp")
+                if r["type"] == _USER_PROCESS
+            ]
+        except FileNotFoundError:
+            # No utmp on this host; fall back to who
+            result = await _run(["who"])
+            return [{"raw": result.stdout}]
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_get_user_info", Permission.READ_ONLY)
     async def tool_get_user_info(self, username: str) -> Dict[str, Any]:
-        result = subprocess.run(["id", username], capture_output=True, text=True)
-        return {"info": result.stdout}
+        # pwd lookup + getgrouplist resolve this in-process; no id fork
+        try:
+            p = pwd.getpwnam(username)
+        except KeyError:
+            return {"error": f"No such user: {username}"}
+        try:
+            gids = os.getgrouplist(username, p.pw_gid)
+            groups = []
+            for gid in gids:
+                try:
+                    groups.append(grp.getgrgid(gid).gr_name)
+                except KeyError:
+                    groups.append(str(gid))
+            return {
+                "name": p.pw_name,
+                "uid": p.pw_uid,
+                "gid": p.pw_gid,
+                "home": p.pw_dir,
+                "shell": p.pw_shell,
+                "groups": groups,
+            }
+        except Exception as e:
+            return {"error": str(e)}
 
     # ==================== SECURITY/AUDIT ====================
 
     @require_permission("tool_list_open_ports", Permission.READ_ONLY)
+    @ttl_cache(5.0)
     async def tool_list_open_ports(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["ss", "-tunlp"], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        try:
+            return _query_sockets(listening=True)
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_check_selinux_status", Permission.READ_ONLY)
     async def tool_check_selinux_status(self) -> Dict[str, Any]:
         try:
-            result = subprocess.run(["getenforce"], capture_output=True, text=True, timeout=5)
+            result = await _run(["getenforce"], timeout=5)
             if result.returncode != 0:
                 return {"status": "not_available", "error": "SELinux not installed or not enabled"}
             return {"status": result.stdout.strip()}
@@ -1123,7 +1987,7 @@ class ExtendedMCPTools:
     @require_permission("tool_check_apparmor_status", Permission.READ_ONLY)
     async def tool_check_apparmor_status(self) -> Dict[str, Any]:
         try:
-            result = subprocess.run(["aa-status"], capture_output=True, text=True, timeout=5)
+            result = await _run(["aa-status"], timeout=5)
             if result.returncode != 0:
                 return {"status": "not_available", "error": "AppArmor not installed or not enabled"}
             return {"status": result.stdout}
@@ -1134,13 +1998,23 @@ class ExtendedMCPTools:
 
     @require_permission("tool_list_sudo_users", Permission.READ_ONLY)
     async def tool_list_sudo_users(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["getent", "group", "sudo"], capture_output=True, text=True)
+        result = await _run(["getent", "group", "sudo"])
         return [{"raw": result.stdout}]
 
     @require_permission("tool_check_failed_logins", Permission.READ_ONLY)
     async def tool_check_failed_logins(self, limit: int = 50) -> List[Dict[str, Any]]:
-        result = subprocess.run(["lastb", "-n", str(limit)], capture_output=True, text=True)
-        return [{"raw": result.stdout}]
+        # btmp is just packed utmp records; read the tail instead of forking lastb
+        try:
+            records = _read_utmp("/var/log/btmp", tail_records=limit)
+            records.reverse()  # newest first, like lastb
+            return [{"user": r["user"], "line": r["line"], "host": r["host"], "time": r["time"]}
+                    for r in records]
+        except FileNotFoundError:
+            return []
+        except Exception:
+            # Unreadable or non-glibc record layout; let lastb handle it
+            result = await _run(["lastb", "-n", str(limit)])
+            return [{"raw": result.stdout}]
 
     @require_permission("tool_list_cron_jobs", Permission.READ_ONLY)
     async def tool_list_cron_jobs(self, user: str = None) -> List[Dict[str, Any]]:
@@ -1148,7 +2022,7 @@ class ExtendedMCPTools:
             cmd = ["crontab", "-l"]
             if user:
                 cmd.extend(["-u", user])
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = await _run(cmd, timeout=5)
             if result.returncode != 0:
                 # crontab -l returns 1 if no crontab exists (not an error)
                 if "no crontab" in result.stderr.lower():
@@ -1162,11 +2036,22 @@ class ExtendedMCPTools:
 
     @require_permission("tool_scan_listening_services", Permission.READ_ONLY)
     async def tool_scan_listening_services(self) -> List[Dict[str, Any]]:
+        # /proc/net readers plus one inode-to-pid pass over /proc/*/fd give
+        # the structured equivalent of ss -tulpn with no fork
+        try:
+            loop = asyncio.get_running_loop()
+            rows = _query_sockets(listening=True)
+            owners = await loop.run_in_executor(None, _socket_inode_owners)
+            for row in rows:
+                row["pid"] = owners.get(row["inode"])
+            return rows
+        except Exception:
+            pass
         try:
-            result = subprocess.run(["ss", "-tulpn"], capture_output=True, text=True, timeout=5)
+            result = await _run(["ss", "-tulpn"], timeout=5)
             if result.returncode != 0:
                 # Fallback to netstat if ss fails
-                result = subprocess.run(["netstat", "-tulpn"], capture_output=True, text=True, timeout=5)
+                result = await _run(["netstat", "-tulpn"], timeout=5)
                 if result.returncode != 0:
                     return [{"error": "Both ss and netstat failed", "raw": None}]
             return [{"raw": result.stdout}]
@@ -1177,48 +2062,91 @@ class ExtendedMCPTools:
 
     @require_permission("tool_check_file_permissions", Permission.READ_ONLY)
     async def tool_check_file_permissions(self, path: str) -> Dict[str, Any]:
-        result = subprocess.run(["ls", "-la", path], capture_output=True, text=True)
-        return {"permissions": result.stdout}
+        # One lstat syscall instead of an ls fork; names via cached NSS lookups
+        try:
+            st = os.lstat(path)
+        except OSError as e:
+            return {"error": str(e)}
+        return {
+            "path": path,
+            "mode": stat.filemode(st.st_mode),
+            "octal": oct(st.st_mode & 0o7777),
+            "uid": st.st_uid,
+            "gid": st.st_gid,
+            "user": _user_name(st.st_uid),
+            "group": _group_name(st.st_gid),
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+        }
 
     @require_permission("tool_list_suid_files", Permission.READ_ONLY)
+    @_heavy
     async def tool_list_suid_files(self, path: str = "/") -> List[Dict[str, Any]]:
-        result = subprocess.run(["find", path, "-type", "f", "-perm", "/4000", "-ls"], capture_output=True, text=True, timeout=120)
-        return [{"suid_files": result.stdout}]
+        # Walk with os.scandir instead of forking find; the dirent carries
+        # the type so only regular files pay a stat, and results come back
+        # structured instead of as find -ls text.
+        def walk(root: str):
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                yield from walk(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                if st.st_mode & 0o4000:
+                                    yield {
+                                        "path": entry.path,
+                                        "uid": st.st_uid,
+                                        "mode": oct(st.st_mode & 0o7777),
+                                    }
+                        except OSError:
+                            continue
+            except OSError:
+                return
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: list(walk(path)))
+        except Exception as e:
+            return [{"error": str(e)}]
 
     @require_permission("tool_check_system_integrity", Permission.READ_ONLY)
     async def tool_check_system_integrity(self) -> Dict[str, Any]:
         """Check system integrity using available tools"""
-        # Try AIDE first
-        try:
-            result = subprocess.run(["aide", "--check"], capture_output=True, text=True, timeout=30)
-            return {"tool": "aide", "output": result.stdout, "available": True}
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        
-        # Try Tripwire
-        try:
-            result = subprocess.run(["tripwire", "--check"], capture_output=True, text=True, timeout=30)
-            return {"tool": "tripwire", "output": result.stdout, "available": True}
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        
+        # Probe for the checkers in pure Python first so a missing binary
+        # costs a PATH walk, not a 30s spawn-and-wait
+        if _have("aide"):
+            try:
+                result = await _run(["aide", "--check"], timeout=30)
+                return {"tool": "aide", "output": result.stdout, "available": True}
+            except subprocess.TimeoutExpired:
+                pass
+
+        if _have("tripwire"):
+            try:
+                result = await _run(["tripwire", "--check"], timeout=30)
+                return {"tool": "tripwire", "output": result.stdout, "available": True}
+            except subprocess.TimeoutExpired:
+                pass
+
         # Fallback: basic package verification (quick check with timeout)
-        try:
-            # Debian/Ubuntu - use faster verification
-            result = subprocess.run(["dpkg", "-l"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
+        if _have("dpkg"):
+            try:
+                # Debian/Ubuntu - use faster verification
+                result = await _run(["dpkg", "-l"], timeout=5)
+            except subprocess.TimeoutExpired:
+                result = None
+            if result is not None and result.returncode == 0:
                 # Just count installed packages as a simple integrity check
-                lines = [l for l in result.stdout.splitlines() if l.startswith('ii')]
                 return {
                     "tool": "dpkg",
                     "status": "ok",
-                    "packages_verified": len(lines),
+                    "packages_verified": len(_DPKG_INSTALLED.findall(result.stdout)),
                     "available": True,
                     "note": "Quick package count check (full verify requires aide/tripwire)"
                 }
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        
+
         return {
             "available": False,
             "status": "not_available",
@@ -1230,18 +2158,30 @@ class ExtendedMCPTools:
 
     @require_permission("tool_get_kernel_version", Permission.READ_ONLY)
     async def tool_get_kernel_version(self) -> Dict[str, Any]:
-        result = subprocess.run(["uname", "-a"], capture_output=True, text=True)
-        return {"version": result.stdout.strip()}
+        # os.uname is a single syscall; cached at module level so every call
+        # after the first is a plain dict hit
+        return _kernel_version()
 
     @require_permission("tool_list_kernel_modules", Permission.READ_ONLY)
+    @ttl_cache(5.0)
     async def tool_list_kernel_modules(self) -> List[Dict[str, Any]]:
         try:
-            result = subprocess.run(["lsmod"], capture_output=True, text=True, timeout=5)
-            if result.returncode != 0:
-                return [{"error": f"lsmod failed: {result.stderr}", "raw": None}]
-            return [{"raw": result.stdout}]
+            # lsmod is just a pretty-printer for /proc/modules
+            modules = []
+            for line in _read_proc_large("/proc/modules").splitlines():
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                modules.append({
+                    "name": parts[0],
+                    "size": int(parts[1]),
+                    "used_by_count": int(parts[2]),
+                    "used_by": [d for d in parts[3].rstrip(",").split(",") if d != "-"]
+                    if len(parts) > 3 else [],
+                })
+            return modules
         except FileNotFoundError:
-            return [{"error": "lsmod command not found - install kmod package", "raw": None}]
+            return [{"error": "/proc/modules not available", "raw": None}]
         except Exception as e:
             return [{"error": str(e), "raw": None}]
 
@@ -1251,32 +2191,76 @@ class ExtendedMCPTools:
         cmd = ["modprobe", module]
         if params:
             cmd.append(params)
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(cmd)
+        return {"status": _status_of(result)}
 
     @require_permission("tool_unload_kernel_module", Permission.AI_ASK)
     @permission_audit("tool_unload_kernel_module")
     async def tool_unload_kernel_module(self, module: str) -> Dict[str, Any]:
-        result = subprocess.run(["modprobe", "-r", module], capture_output=True, text=True)
-        return {"status": "ok" if result.returncode == 0 else "error"}
+        result = await _run(["modprobe", "-r", module])
+        return {"status": _status_of(result)}
 
     @require_permission("tool_get_kernel_cmdline", Permission.READ_ONLY)
     async def tool_get_kernel_cmdline(self) -> Dict[str, Any]:
         try:
-            with open("/proc/cmdline", "r") as f:
-                return {"cmdline": f.read().strip()}
+            return {"cmdline": _kernel_cmdline()}
         except Exception as e:
             return {"error": str(e)}
 
     @require_permission("tool_list_cgroups", Permission.READ_ONLY)
     async def tool_list_cgroups(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["systemd-cgls"], capture_output=True, text=True)
+        # systemd-cgls only walks /sys/fs/cgroup and pretty-prints it;
+        # walk it ourselves and return structured rows
+        def walk(root: str):
+            rows = []
+            stack = [root]
+            while stack:
+                d = stack.pop()
+                try:
+                    # cgroup.procs can exceed one 8 KB pread for large
+                    # cgroups; the loop variant avoids truncated pids
+                    procs = _read_proc_large(os.path.join(d, "cgroup.procs")).split()
+                except OSError:
+                    procs = []
+                rows.append({
+                    "cgroup": d[len(root):] or "/",
+                    "procs": [int(p) for p in procs],
+                })
+                try:
+                    with os.scandir(d) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                except OSError:
+                    continue
+            return rows
+
+        try:
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(None, walk, "/sys/fs/cgroup")
+            if rows:
+                return rows
+        except Exception:
+            pass
+        result = await _run(["systemd-cgls"])
         return [{"raw": result.stdout}]
 
     @require_permission("tool_get_cgroup_stats", Permission.READ_ONLY)
     async def tool_get_cgroup_stats(self, cgroup: str) -> Dict[str, Any]:
-        result = subprocess.run(["systemctl", "show", cgroup], capture_output=True, text=True)
-        return {"stats": result.stdout}
+        stats = await self.tool_get_cgroup_stats_batch([cgroup])
+        return {"stats": stats.get(cgroup, {})}
+
+    @require_permission("tool_get_cgroup_stats_batch", Permission.READ_ONLY)
+    async def tool_get_cgroup_stats_batch(self, cgroups: List[str]) -> Dict[str, Any]:
+        """Stats for several units from one systemctl show invocation."""
+        if not cgroups:
+            return {}
+        result = await _run(["systemctl", "show", "--no-pager", *cgroups])
+        # Blocks arrive blank-line separated, in argument order
+        stats = {}
+        for unit, block in zip(cgroups, result.stdout.strip().split("\n\n")):
+            stats[unit] = dict(_SHOW_PROP.findall(block))
+        return stats
 
     @require_permission("tool_set_cgroup_limit", Permission.AI_ASK)
     @permission_audit("tool_set_cgroup_limit")
@@ -1285,35 +2269,92 @@ class ExtendedMCPTools:
 
     @require_permission("tool_list_namespaces", Permission.READ_ONLY)
     async def tool_list_namespaces(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["lsns"], capture_output=True, text=True)
+        result = await _run(["lsns"])
         return [{"raw": result.stdout}]
 
+    # Capability sets keyed by (pid, /proc/<pid> ctime) so pid reuse
+    # invalidates; capabilities rarely change within a process lifetime.
+    # LRU-bounded so pid churn on a long-running server cannot grow it
+    # without limit
+    _caps_cache: "collections.OrderedDict[tuple, Dict[str, str]]" = collections.OrderedDict()
+    _CAPS_CACHE_MAX = 256
+
     @require_permission("tool_get_capabilities", Permission.READ_ONLY)
     async def tool_get_capabilities(self, pid: int) -> Dict[str, Any]:
-        result = subprocess.run(["getpcaps", str(pid)], capture_output=True, text=True)
-        return {"capabilities": result.stdout}
+        try:
+            key = (pid, os.stat(f"/proc/{pid}").st_ctime)
+        except OSError:
+            return {"error": f"No such process: {pid}"}
+        cached = self._caps_cache.get(key)
+        if cached is not None:
+            self._caps_cache.move_to_end(key)
+            return cached
+        try:
+            caps = {}
+            for line in _read_proc(f"/proc/{pid}/status").splitlines():
+                if line.startswith("Cap"):
+                    name, _, value = line.partition(":")
+                    caps[name.lower()] = value.strip()
+            result = {"pid": pid, "capabilities": caps}
+        except OSError as e:
+            return {"error": str(e)}
+        self._caps_cache[key] = result
+        while len(self._caps_cache) > self._CAPS_CACHE_MAX:
+            self._caps_cache.popitem(last=False)
+        return result
 
     # ==================== MONITORING/LOGGING ====================
 
     @require_permission("tool_get_load_average", Permission.READ_ONLY)
     async def tool_get_load_average(self) -> Dict[str, Any]:
         try:
-            with open("/proc/loadavg", "r") as f:
-                load = f.read().strip().split()
-                return {"1min": load[0], "5min": load[1], "15min": load[2]}
+            load = self._pread_proc("/proc/loadavg").split()
+            return {"1min": load[0], "5min": load[1], "15min": load[2]}
         except Exception as e:
             return {"error": str(e)}
 
     @require_permission("tool_get_uptime", Permission.READ_ONLY)
+    @ttl_cache(1.0)
     async def tool_get_uptime(self) -> Dict[str, Any]:
-        result = subprocess.run(["uptime", "-p"], capture_output=True, text=True)
-        return {"uptime": result.stdout.strip()}
+        # /proc/uptime is what the uptime binary reads anyway
+        try:
+            seconds = float(self._pread_proc("/proc/uptime").split()[0])
+        except Exception as e:
+            return {"error": str(e)}
+        minutes, _ = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        days, hours = divmod(hours, 24)
+        parts = []
+        if days:
+            parts.append(f"{days} day{'s' if days != 1 else ''}")
+        if hours:
+            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+        return {"uptime": "up " + ", ".join(parts), "seconds": seconds}
 
     @require_permission("tool_list_zombie_processes", Permission.READ_ONLY)
     async def tool_list_zombie_processes(self) -> List[Dict[str, Any]]:
-        result = subprocess.run(["ps", "aux"], capture_output=True, text=True)
-        zombies = [line for line in result.stdout.split("\n") if " Z " in line]
-        return [{"zombies": "\n".join(zombies)}]
+        # Scan /proc/<pid>/stat directly; no ps fork, no full process snapshot
+        zombies = []
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/stat", "r") as f:
+                    stat = f.read()
+            except OSError:
+                continue  # raced with process exit
+            # comm sits between parens and may itself contain spaces or ')',
+            # so split on the last ')' before reading state and ppid
+            head, _, rest = stat.rpartition(")")
+            fields = rest.split()
+            if fields and fields[0] == "Z":
+                zombies.append({
+                    "pid": int(entry.name),
+                    "ppid": int(fields[1]),
+                    "comm": head.partition("(")[2],
+                })
+        return zombies
 
     @require_permission("tool_get_process_tree", Permission.READ_ONLY)
     async def tool_get_process_tree(self, pid: int = None) -> Dict[str, Any]:
@@ -1321,7 +2362,7 @@ class ExtendedMCPTools:
             cmd = ["pstree", "-p"]
             if pid:
                 cmd.append(str(pid))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = await _run(cmd, timeout=5)
             if result.returncode != 0:
                 return {"error": f"pstree failed: {result.stderr}", "tree": None}
             return {"tree": result.stdout}
@@ -1333,40 +2374,156 @@ class ExtendedMCPTools:
             return {"error": str(e), "tree": None}
 
     @require_permission("tool_strace_process", Permission.READ_ONLY)
-    async def tool_strace_process(self, pid: int, duration: int = 5) -> Dict[str, Any]:
-        result = subprocess.run(["timeout", str(duration), "strace", "-p", str(pid)], capture_output=True, text=True)
-        return {"strace": result.stderr}  # strace outputs to stderr
+    async def tool_strace_process(self, pid: int, duration: int = 5,
+                                  max_lines: int = 4096) -> Dict[str, Any]:
+        # Stream strace's stderr into a bounded line ring; a chatty process
+        # can emit MBs in a few seconds and only the tail is interesting
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "strace", "-p", str(pid),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            return {"error": "strace command not found - install strace package"}
+
+        ring = collections.deque(maxlen=max_lines)
+
+        async def _collect():
+            async for line in proc.stderr:
+                ring.append(line)
+
+        try:
+            await asyncio.wait_for(_collect(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if proc.returncode is None:
+                proc.terminate()
+            await proc.wait()
+        return {"strace": b"".join(ring).decode(errors="replace")}
 
     @require_permission("tool_lsof_process", Permission.READ_ONLY)
     async def tool_lsof_process(self, pid: int) -> Dict[str, Any]:
-        result = subprocess.run(["lsof", "-p", str(pid)], capture_output=True, text=True)
+        result = await _run(["lsof", "-p", str(pid)])
         return {"open_files": result.stdout}
 
+    @require_permission("tool_snapshot_processes", Permission.READ_ONLY)
+    async def tool_snapshot_processes(self, pids: List[int]) -> Dict[str, Any]:
+        """
+        One-pass snapshot of several processes.
+
+        Reads status, maps and the fd table of each pid once, so a sweep
+        over N pids costs O(N) procfs opens instead of one walk per
+        per-pid tool invoked.
+        """
+        def snapshot():
+            out = {}
+            for pid in pids:
+                info: Dict[str, Any] = {"pid": pid}
+                try:
+                    status = {}
+                    for line in _read_proc(f"/proc/{pid}/status").splitlines():
+                        key, _, value = line.partition(":")
+                        status[key] = value.strip()
+                    info["name"] = status.get("Name")
+                    info["state"] = status.get("State")
+                    info["ppid"] = int(status.get("PPid", -1))
+                    info["vm_rss_kb"] = int(status.get("VmRSS", "0 kB").split()[0]) \
+                        if "VmRSS" in status else None
+                except OSError:
+                    out[str(pid)] = {"error": f"No such process: {pid}"}
+                    continue
+                try:
+                    info["memory_map"] = _read_proc_large(f"/proc/{pid}/maps")
+                except OSError:
+                    info["memory_map"] = None
+                try:
+                    fd_dir = f"/proc/{pid}/fd"
+                    info["open_fds"] = len(os.listdir(fd_dir))
+                except OSError:
+                    info["open_fds"] = None
+                out[str(pid)] = info
+            return out
+
+        return await asyncio.get_running_loop().run_in_executor(None, snapshot)
+
     @require_permission("tool_get_memory_map", Permission.READ_ONLY)
     async def tool_get_memory_map(self, pid: int) -> Dict[str, Any]:
+        # maps can run to tens of thousands of VMAs on JIT-heavy processes;
+        # read into one buffer and hand back structured rows so callers
+        # never re-split the text
+        def parse():
+            vmas = []
+            for line in _read_proc_large(f"/proc/{pid}/maps").splitlines():
+                parts = line.split(None, 5)
+                if len(parts) < 5:
+                    continue
+                start, _, end = parts[0].partition("-")
+                vmas.append({
+                    "start": int(start, 16),
+                    "end": int(end, 16),
+                    "perms": parts[1],
+                    "offset": int(parts[2], 16),
+                    "dev": parts[3],
+                    "inode": int(parts[4]),
+                    "path": parts[5] if len(parts) > 5 else "",
+                })
+            return vmas
+
         try:
-            with open(f"/proc/{pid}/maps", "r") as f:
-                return {"memory_map": f.read()}
+            vmas = await asyncio.get_running_loop().run_in_executor(None, parse)
+            return {"pid": pid, "vma_count": len(vmas), "vmas": vmas}
         except Exception as e:
             return {"error": str(e)}
 
     @require_permission("tool_monitor_realtime", Permission.READ_ONLY)
     async def tool_monitor_realtime(self, duration: int = 5) -> Dict[str, Any]:
-        result = subprocess.run(["timeout", str(duration), "top", "-bn1"], capture_output=True, text=True)
+        result = await _run(["timeout", str(duration), "top", "-bn1"])
         return {"snapshot": result.stdout}
 
     @require_permission("tool_analyze_logs", Permission.READ_ONLY)
-    async def tool_analyze_logs(self, since: str = "1h", severity: str = "err") -> List[Dict[str, Any]]:
-        cmd = ["journalctl", "--since", since, "-p", severity, "--no-pager"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return [{"logs": result.stdout}]
+    async def tool_analyze_logs(self, since: str = "1h", severity: str = "err",
+                                limit: int = 10000) -> List[Dict[str, Any]]:
+        # Stream JSON records and keep only the fields we return; hours of
+        # journal no longer have to fit in one stdout buffer
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "journalctl", "--since", since, "-p", severity,
+                "--no-pager", "--output=json", f"--lines={limit}",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            return [{"error": "journalctl command not found"}]
+        entries = []
+        try:
+            async for line in proc.stdout:
+                if len(entries) >= limit:
+                    proc.terminate()
+                    break
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    continue
+                entries.append({
+                    "timestamp": record.get("__REALTIME_TIMESTAMP"),
+                    "priority": record.get("PRIORITY"),
+                    "unit": record.get("_SYSTEMD_UNIT"),
+                    "message": record.get("MESSAGE"),
+                })
+        finally:
+            await proc.wait()
+        return entries
 
     @require_permission("tool_get_boot_messages", Permission.READ_ONLY)
     async def tool_get_boot_messages(self, level: int = None) -> List[Dict[str, Any]]:
         cmd = ["dmesg"]
         if level is not None:
             cmd.extend(["-l", str(level)])
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await _run(cmd)
         return [{"dmesg": result.stdout}]
 
     # ===== MISSING DESTRUCTIVE TOOL IMPLEMENTATIONS =====
@@ -1374,8 +2531,7 @@ class ExtendedMCPTools:
     async def tool_start_unit(self, unit: str) -> Dict[str, Any]:
         """Start a systemd unit"""
         try:
-            result = subprocess.run(['systemctl', 'start', unit], 
-                                  capture_output=True, text=True, timeout=30)
+            result = await _run(["systemctl", "start", unit], timeout=30)
             return {
                 "status": "started" if result.returncode == 0 else "failed",
                 "unit": unit,
@@ -1387,8 +2543,7 @@ class ExtendedMCPTools:
     async def tool_stop_unit(self, unit: str) -> Dict[str, Any]:
         """Stop a systemd unit"""
         try:
-            result = subprocess.run(['systemctl', 'stop', unit], 
-                                  capture_output=True, text=True, timeout=30)
+            result = await _run(["systemctl", "stop", unit], timeout=30)
             return {
                 "status": "stopped" if result.returncode == 0 else "failed",
                 "unit": unit,
@@ -1400,8 +2555,19 @@ class ExtendedMCPTools:
     async def tool_set_file_permissions(self, path: str, mode: str) -> Dict[str, Any]:
         """Set file permissions (chmod)"""
         try:
-            import os
-            os.chmod(path, int(mode, 8))
+            mode_bits = int(mode, 8)
+        except ValueError:
+            return {"error": f"Invalid octal mode: {mode}"}
+        try:
+            # Resolve the parent once, then chmod the basename relative to
+            # that fd: one path walk instead of two, and the target can't be
+            # swapped between resolution and chmod
+            parent, name = os.path.split(os.path.abspath(path))
+            dir_fd = os.open(parent, os.O_PATH | os.O_DIRECTORY)
+            try:
+                os.chmod(name, mode_bits, dir_fd=dir_fd)
+            finally:
+                os.close(dir_fd)
             return {"status": "ok", "path": path, "mode": mode}
         except Exception as e:
             return {"error": str(e)}
@@ -1409,8 +2575,7 @@ class ExtendedMCPTools:
     async def tool_clear_journal(self) -> Dict[str, Any]:
         """Clear systemd journal logs"""
         try:
-            result = subprocess.run(['journalctl', '--vacuum-time=1s'], 
-                                  capture_output=True, text=True, timeout=30)
+            result = await _run(["journalctl", "--vacuum-time=1s"], timeout=30)
             return {
                 "status": "cleared" if result.returncode == 0 else "failed",
                 "output": result.stdout
@@ -1421,8 +2586,7 @@ class ExtendedMCPTools:
     async def tool_set_hostname(self, hostname: str) -> Dict[str, Any]:
         """Set system hostname"""
         try:
-            result = subprocess.run(['hostnamectl', 'set-hostname', hostname], 
-                                  capture_output=True, text=True, timeout=10)
+            result = await _run(["hostnamectl", "set-hostname", hostname], timeout=10)
             return {
                 "status": "ok" if result.returncode == 0 else "failed",
                 "hostname": hostname,
@@ -1430,49 +2594,48 @@ class ExtendedMCPTools:
             }
         except Exception as e:
             return {"error": str(e)}
-            result = subprocess.run(['journalctl', '--vacuum-time=1s'], capture_output=True, text=True, check=True)
-            return {"status": "ok", "output": result.stdout}
-        except Exception as e:
-            return {"error": str(e)}
 
     # ==================== DESTRUCTIVE OPERATIONS ====================
     
-    @require_permission("tool_start_service", Permission.AI_AUTO)
-    async def tool_start_service(self, service: str) -> Dict[str, Any]:
-        """Start a systemd service"""
-        try:
-            result = subprocess.run(['systemctl', 'start', service], capture_output=True, text=True, check=True)
-            return {"status": "started", "service": service, "output": result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {"error": f"Failed to start {service}: {e.stderr}"}
-    
-    @require_permission("tool_stop_service", Permission.AI_AUTO)
-    async def tool_stop_service(self, service: str) -> Dict[str, Any]:
-        """Stop a systemd service"""
-        try:
-            result = subprocess.run(['systemctl', 'stop', service], capture_output=True, text=True, check=True)
-            return {"status": "stopped", "service": service, "output": result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {"error": f"Failed to stop {service}: {e.stderr}"}
-    
-    @require_permission("tool_restart_service", Permission.AI_AUTO)
-    async def tool_restart_service(self, service: str) -> Dict[str, Any]:
-        """Restart a systemd service"""
-        try:
-            result = subprocess.run(['systemctl', 'restart', service], capture_output=True, text=True, check=True)
-            return {"status": "restarted", "service": service, "output": result.stdout}
-        except subprocess.CalledProcessError as e:
-            return {"error": f"Failed to restart {service}: {e.stderr}"}
-    
-    @require_permission("tool_reload_service", Permission.AI_AUTO)
-    async def tool_reload_service(self, service: str) -> Dict[str, Any]:
-        """Reload a systemd service configuration"""
+    async def _systemctl_batch(self, action: str, units: List[str]) -> Dict[str, Any]:
+        """
+        Apply one systemctl verb to any number of units with a single fork.
+
+        systemctl accepts multiple unit arguments, so N-unit operations
+        cost one subprocess (and one internal systemd transaction) instead
+        of N. The D-Bus multi-call pattern would avoid the fork entirely,
+        but this project carries no D-Bus bindings.
+        """
+        if not units:
+            return {"error": "No units given"}
         try:
-            result = subprocess.run(['systemctl', 'reload', service], capture_output=True, text=True, check=True)
-            return {"status": "reloaded", "service": service, "output": result.stdout}
+            result = await _run(["systemctl", action, *units], timeout=60, check=True)
+            return {"status": _OK, "action": action, "units": units, "output": result.stdout}
         except subprocess.CalledProcessError as e:
-            return {"error": f"Failed to reload {service}: {e.stderr}"}
-    
+            return {"error": f"Failed to {action} {', '.join(units)}: {e.stderr}"}
+        except subprocess.TimeoutExpired:
+            return {"error": f"systemctl {action} timed out"}
+
+    @require_permission("tool_manage_unit", Permission.AI_AUTO)
+    @permission_audit("tool_manage_unit")
+    async def tool_manage_unit(self, action: str, unit: str) -> Dict[str, Any]:
+        """Start, stop, restart or reload a systemd unit"""
+        if action not in ("start", "stop", "restart", "reload"):
+            return {"error": f"Invalid action: {action}. Must be start, stop, restart or reload"}
+        return await self._systemctl_batch(action, [unit])
+
+    @require_permission("tool_systemctl_batch", Permission.AI_AUTO)
+    @permission_audit("tool_systemctl_batch")
+    async def tool_systemctl_batch(self, action: str, units: List[str]) -> Dict[str, Any]:
+        """Apply one systemctl action to many units in a single call"""
+        # Same action set as tool_manage_unit: enable/disable change
+        # persistent boot state and stay behind the AI_ASK single-unit
+        # tools rather than riding this AI_AUTO batch path
+        if action not in ("start", "stop", "restart", "reload"):
+            return {"error": f"Invalid action: {action}. Must be start, stop, restart or reload"}
+        return await self._systemctl_batch(action, units)
+
+
     @require_permission("tool_reboot_system", Permission.AI_ASK)
     @permission_audit("tool_reboot_system")
     async def tool_reboot_system(self, delay: int = 0) -> Dict[str, Any]:
@@ -1480,20 +2643,16 @@ class ExtendedMCPTools:
         try:
             # Try systemctl reboot first (works in containers)
             if delay > 0:
-                result = subprocess.run(['systemctl', 'reboot', '--message', f'Scheduled reboot in {delay}s'], 
-                                      capture_output=True, text=True, timeout=5)
+                result = await _run(["systemctl", "reboot", "--message", f"Scheduled reboot in {delay}s"], timeout=5)
             else:
-                result = subprocess.run(['systemctl', 'reboot'], 
-                                      capture_output=True, text=True, timeout=5)
+                result = await _run(["systemctl", "reboot"], timeout=5)
             
             # If systemctl fails, try traditional commands
             if result.returncode != 0:
                 if delay > 0:
-                    result = subprocess.run(['shutdown', '-r', f'+{delay//60}'], 
-                                          capture_output=True, text=True, timeout=5)
+                    result = await _run(["shutdown", "-r", f"+{delay//60}"], timeout=5)
                 else:
-                    result = subprocess.run(['reboot'], 
-                                          capture_output=True, text=True, timeout=5)
+                    result = await _run(["reboot"], timeout=5)
             
             return {"status": "reboot_scheduled", "delay_seconds": delay, 
                    "output": result.stdout or result.stderr, "returncode": result.returncode}
@@ -1514,8 +2673,7 @@ class ExtendedMCPTools:
             # Try setenforce for runtime change
             if mode in ["enforcing", "permissive"]:
                 mode_value = "1" if mode == "enforcing" else "0"
-                result = subprocess.run(['setenforce', mode_value], 
-                                      capture_output=True, text=True, timeout=5)
+                result = await _run(["setenforce", mode_value], timeout=5)
                 if result.returncode == 0:
                     return {"status": "ok", "mode": mode, "method": "setenforce"}
                 # If setenforce fails, SELinux might not be available
@@ -1541,8 +2699,7 @@ class ExtendedMCPTools:
             
             # If no profile specified, try to affect all profiles
             if mode == "disable":
-                result = subprocess.run(['systemctl', 'stop', 'apparmor'], 
-                                      capture_output=True, text=True, timeout=10)
+                result = await _run(["systemctl", "stop", "apparmor"], timeout=10)
                 return {"status": "ok" if result.returncode == 0 else "partial", 
                        "mode": mode, "output": result.stdout or result.stderr}
             elif profile:
@@ -1551,13 +2708,12 @@ class ExtendedMCPTools:
                     cmd = ['aa-enforce', profile]
                 else:  # complain
                     cmd = ['aa-complain', profile]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                result = await _run(cmd, timeout=10)
                 return {"status": "ok" if result.returncode == 0 else "failed",
                        "mode": mode, "profile": profile, "output": result.stdout or result.stderr}
             else:
                 # Try to set mode for all profiles
-                result = subprocess.run(['systemctl', 'restart', 'apparmor'], 
-                                      capture_output=True, text=True, timeout=10)
+                result = await _run(["systemctl", "restart", "apparmor"], timeout=10)
                 return {"status": "ok" if result.returncode == 0 else "partial",
                        "mode": mode, "message": "AppArmor service restarted"}
         except FileNotFoundError as e:
@@ -5,88 +5,279 @@ Provides AI-powered system management using Ollama models.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-import subprocess
+import os
+import re
+import time
+import urllib.request
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
+import aiohttp
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    _json_loads = json.loads
+
+try:
+    import msgspec
+
+    # Narrow schemas: only the fields we actually read get allocated,
+    # which skips building dicts for the rest of the response blob
+    class _GenResp(msgspec.Struct):
+        response: str = ""
+        done: bool = False
+
+    class _ChatMsg(msgspec.Struct):
+        role: str = "assistant"
+        content: str = ""
+
+    class _ChatResp(msgspec.Struct):
+        message: Optional[_ChatMsg] = None
+
+    _GEN_DECODER = msgspec.json.Decoder(_GenResp)
+    _CHAT_DECODER = msgspec.json.Decoder(_ChatResp)
+except ImportError:
+    _GEN_DECODER = _CHAT_DECODER = None
+
 logger = logging.getLogger(__name__)
 
+# Static prompt scaffolding built once at import; per-call work is a
+# single .format() with the injected fields
+_ANALYZE_SYSTEM = """You are systerd, an AI system administrator.
+Analyze system issues and provide actionable recommendations.
+Format your response as JSON with fields: analysis, recommendations, commands."""
 
-class OllamaClient:
-    """Client for interacting with Ollama API"""
-    
-    def __init__(self, base_url: str = "http://localhost:11434", 
-                 model: str = "gemma3:12b"):
+_ANALYZE_TMPL = """Issue: {issue}
+
+Context:
+{ctx}
+
+Analyze the issue and provide:
+1. Root cause analysis
+2. Recommended actions
+3. Commands to execute (if any)"""
+
+_OPTIMIZE_TMPL = """Based on the following system metrics, suggest optimizations:
+
+{metrics}
+
+Provide specific optimization recommendations for:
+- CPU usage
+- Memory management
+- Disk I/O
+- Network performance"""
+
+# Opt-in response cache bounds (per client)
+_RESPONSE_CACHE_TTL = 60.0
+_RESPONSE_CACHE_MAX = 128
+
+# Models often wrap JSON answers in a markdown fence; one fused search
+# replaces the double linear find() scan
+_JSON_FENCE = re.compile(r"```json\s*(.*?)```", re.S)
+
+# Resolved once at import so per-client construction does no environment
+# lookups; OLLAMA_HOST matches the variable the ollama CLI itself honors
+_DEFAULT_BASE_URL = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+_DEFAULT_MODEL = os.environ.get("SYSTERD_OLLAMA_MODEL", "gemma3:12b")
+
+# One keep-alive session per Ollama endpoint, shared by every client so
+# concurrent generations reuse pooled connections instead of paying a
+# TCP handshake (or blocking the event loop) per call.
+_SESSIONS: Dict[str, aiohttp.ClientSession] = {}
+
+
+def _get_session(base_url: str) -> aiohttp.ClientSession:
+    """Lazily create the shared session for an endpoint (needs a running loop)."""
+    session = _SESSIONS.get(base_url)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            base_url=base_url,
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20),
+            timeout=aiohttp.ClientTimeout(total=60, connect=2),
+        )
+        _SESSIONS[base_url] = session
+    return session
+
+
+class _OllamaBackend:
+    """Per-endpoint state shared by every model client.
+
+    Availability is a property of the server, not the model, so the probe
+    runs once per base_url instead of once per OllamaClient.
+    """
+
+    _instances: Dict[str, "_OllamaBackend"] = {}
+    # Probe results shared across backend lifetimes, 30 s TTL per endpoint
+    _availability_cache: Dict[str, tuple] = {}
+
+    def __init__(self, base_url: str):
         self.base_url = base_url
-        self.model = model
         self.available = False
+        # Ollama runs OLLAMA_NUM_PARALLEL requests at once and queues the
+        # rest server-side; bounding concurrency here keeps the queue on
+        # our side of the wire instead of head-of-line-blocking the server
+        self.sem = asyncio.Semaphore(int(os.environ.get("OLLAMA_NUM_PARALLEL", 4)))
         self._check_availability()
-    
+
+    @classmethod
+    def for_url(cls, base_url: str) -> "_OllamaBackend":
+        backend = cls._instances.get(base_url)
+        if backend is None:
+            backend = cls._instances[base_url] = cls(base_url)
+        return backend
+
     def _check_availability(self):
         """Check if Ollama is available"""
+        cached = self._availability_cache.get(self.base_url)
+        if cached is not None and time.monotonic() - cached[0] < 30.0:
+            self.available = cached[1]
+            return
         try:
-            result = subprocess.run(
-                ["curl", "-s", f"{self.base_url}/api/tags"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                self.available = True
+            with urllib.request.urlopen(f"{self.base_url}/api/tags", timeout=2) as resp:
+                self.available = resp.status == 200
+            if self.available:
                 logger.info(f"Ollama is available at {self.base_url}")
             else:
                 logger.debug(f"Ollama not available at {self.base_url} (this is optional)")
         except Exception as e:
             logger.debug(f"Ollama check failed: {e} (optional feature)")
+        self._availability_cache[self.base_url] = (time.monotonic(), self.available)
+
+
+class OllamaClient:
+    """Client for interacting with Ollama API.
+
+    A thin (backend, model) pair: the HTTP pool and availability flag live
+    on the shared per-endpoint backend.
+    """
+
+    def __init__(self, base_url: str = _DEFAULT_BASE_URL,
+                 model: str = _DEFAULT_MODEL):
+        self._backend = _OllamaBackend.for_url(base_url)
+        self.model = model
+        # Opt-in TTL LRU over idempotent prompts; see generate(cache=True)
+        self._cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    @property
+    def base_url(self) -> str:
+        return self._backend.base_url
+
+    @property
+    def available(self) -> bool:
+        return self._backend.available
     
-    async def generate(self, prompt: str, system: str = None, 
-                      temperature: float = 0.7, max_tokens: int = 1000) -> Dict[str, Any]:
-        """Generate completion using Ollama"""
+    async def generate(self, prompt: str, system: str = None,
+                      temperature: float = 0.7, max_tokens: int = 1000,
+                      cache: bool = False) -> Dict[str, Any]:
+        """Generate completion using Ollama.
+
+        cache=True serves repeat prompts (dashboards re-asking about the
+        same metrics) from a short-TTL LRU instead of a new round-trip;
+        leave it off for exploratory chat.
+        """
         if not self.available:
             return {
                 "status": "error",
                 "error": "Ollama not available"
             }
-        
+
+        key = None
+        if cache:
+            key = hashlib.blake2b(repr(
+                (self.model, system, prompt, round(temperature, 2), max_tokens)
+            ).encode()).digest()
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < _RESPONSE_CACHE_TTL:
+                self._cache.move_to_end(key)
+                return dict(hit[1])
+
         try:
-            import requests
-            
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens
-                }
-            }
-            
-            if system:
-                payload["system"] = system
-            
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=60
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            return {
+            parts = []
+            done = False
+            async for fragment, done in self._generate_chunks(
+                    prompt, system, temperature, max_tokens):
+                parts.append(fragment)
+
+            result = {
                 "status": "ok",
-                "response": result.get("response", ""),
+                "response": "".join(parts),
                 "model": self.model,
-                "done": result.get("done", False)
+                "done": done
             }
-        
+            if key is not None:
+                self._cache[key] = (time.monotonic(), dict(result))
+                self._cache.move_to_end(key)
+                while len(self._cache) > _RESPONSE_CACHE_MAX:
+                    self._cache.popitem(last=False)
+            return result
+
         except Exception as e:
             logger.error(f"Ollama generation error: {e}")
             return {
                 "status": "error",
                 "error": str(e)
             }
+
+    async def _generate_chunks(self, prompt, system, temperature, max_tokens):
+        """Yield (fragment, done) pairs from a streaming /api/generate call."""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+
+        if system:
+            payload["system"] = system
+
+        session = _get_session(self.base_url)
+        async with self._backend.sem:
+            async with session.post("/api/generate", json=payload) as response:
+                response.raise_for_status()
+                # NDJSON: one chunk object per line, freed as consumed
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    if _GEN_DECODER is not None:
+                        chunk = _GEN_DECODER.decode(line)
+                        fragment, done = chunk.response, chunk.done
+                    else:
+                        obj = _json_loads(line)
+                        fragment = obj.get("response", "")
+                        done = obj.get("done", False)
+                    yield fragment, done
+                    if done:
+                        break
+
+    async def generate_stream(self, prompt: str, system: str = None,
+                              temperature: float = 0.7, max_tokens: int = 1000):
+        """Stream completion fragments as Ollama produces them.
+
+        Unlike generate(), the first token arrives as soon as the server
+        decodes it instead of after the full completion is buffered.
+        """
+        if not self.available:
+            return
+
+        async for fragment, _done in self._generate_chunks(
+                prompt, system, temperature, max_tokens):
+            if fragment:
+                yield fragment
     
     async def chat(self, messages: List[Dict[str, str]], 
                    temperature: float = 0.7) -> Dict[str, Any]:
@@ -98,8 +289,6 @@ class OllamaClient:
             }
         
         try:
-            import requests
-            
             payload = {
                 "model": self.model,
                 "messages": messages,
@@ -108,22 +297,26 @@ class OllamaClient:
                     "temperature": temperature
                 }
             }
-            
-            response = requests.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-                timeout=60
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            message = result.get("message", {})
-            
+
+            session = _get_session(self.base_url)
+            async with self._backend.sem:
+                async with session.post("/api/chat", json=payload) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+
+            if _CHAT_DECODER is not None:
+                message = _CHAT_DECODER.decode(body).message
+                role = message.role if message else "assistant"
+                content = message.content if message else ""
+            else:
+                message = _json_loads(body).get("message", {})
+                role = message.get("role", "assistant")
+                content = message.get("content", "")
+
             return {
                 "status": "ok",
-                "role": message.get("role", "assistant"),
-                "content": message.get("content", ""),
+                "role": role,
+                "content": content,
                 "model": self.model
             }
         
@@ -137,38 +330,26 @@ class OllamaClient:
     async def analyze_system_issue(self, issue_description: str, 
                                   context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze system issue and provide recommendations"""
-        system_prompt = """You are systerd, an AI system administrator.
-Analyze system issues and provide actionable recommendations.
-Format your response as JSON with fields: analysis, recommendations, commands."""
-        
-        prompt = f"""Issue: {issue_description}
-
-Context:
-{json.dumps(context, indent=2)}
+        prompt = _ANALYZE_TMPL.format(issue=issue_description,
+                                      ctx=_json_dumps(context))
 
-Analyze the issue and provide:
-1. Root cause analysis
-2. Recommended actions
-3. Commands to execute (if any)"""
-        
-        result = await self.generate(prompt, system=system_prompt, temperature=0.3)
+        result = await self.generate(prompt, system=_ANALYZE_SYSTEM, temperature=0.3)
         
         if result["status"] == "ok":
             try:
                 # Try to parse JSON response
                 response_text = result["response"]
-                # Extract JSON from response
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-                
-                analysis = json.loads(response_text)
+                # Extract JSON from a markdown fence, if any
+                fence = _JSON_FENCE.search(response_text)
+                if fence:
+                    response_text = fence.group(1).strip()
+
+                analysis = _json_loads(response_text)
                 return {
                     "status": "ok",
                     "analysis": analysis
                 }
-            except json.JSONDecodeError:
+            except ValueError:
                 # Return as plain text if not JSON
                 return {
                     "status": "ok",
@@ -181,37 +362,31 @@ Analyze the issue and provide:
     
     async def suggest_optimization(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Suggest system optimizations based on metrics"""
-        prompt = f"""Based on the following system metrics, suggest optimizations:
-
-{json.dumps(metrics, indent=2)}
+        prompt = _OPTIMIZE_TMPL.format(metrics=_json_dumps(metrics))
 
-Provide specific optimization recommendations for:
-- CPU usage
-- Memory management
-- Disk I/O
-- Network performance"""
-        
         return await self.generate(prompt, temperature=0.5)
 
 
 class OllamaManager:
     """Manage multiple Ollama models (optional)"""
     
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(self, base_url: str = _DEFAULT_BASE_URL):
         self.base_url = base_url
         self.clients = {}
-        self.default_model = "gemma3:12b"
-        self.fallback_model = "gemma3:12b"
+        self.default_model = _DEFAULT_MODEL
+        self.fallback_model = _DEFAULT_MODEL
         self.available = False
-        
+
         # Initialize default model - check availability first
-        client = OllamaClient(base_url, "gemma3:12b")
+        client = OllamaClient(base_url, self.default_model)
         if client.available:
-            self.clients["gemma3:12b"] = client
+            self.clients[self.default_model] = client
             self.available = True
         else:
             # Store unavailable client for reference
-            self.clients["gemma3:12b"] = client
+            self.clients[self.default_model] = client
+        # Cached for status polls; refreshed whenever self.clients mutates
+        self._models_tuple = tuple(self.clients)
     
     def get_client(self, model: str = None) -> OllamaClient:
         """Get Ollama client for specific model (returns unavailable client if not running)"""
@@ -220,32 +395,74 @@ class OllamaManager:
         
         if model not in self.clients:
             self.clients[model] = OllamaClient(self.base_url, model)
-        
+            self._models_tuple = tuple(self.clients)
+
         return self.clients[model]
     
     def is_available(self) -> bool:
         """Check if Ollama is available"""
         return self.available
     
-    async def generate_with_fallback(self, prompt: str, **kwargs) -> Dict[str, Any]:
-        """Generate with automatic fallback to alternative model"""
+    async def generate_with_fallback(self, prompt: str, hedge: bool = False,
+                                     **kwargs) -> Dict[str, Any]:
+        """Generate with automatic fallback to alternative model.
+
+        With hedge=True and distinct primary/fallback models, both requests
+        are launched together and the first successful one wins (the other
+        is cancelled). Off by default: on a GPU-bound Ollama the duplicate
+        request costs real compute.
+        """
+        if hedge and self.default_model != self.fallback_model:
+            tasks = {
+                asyncio.create_task(
+                    self.get_client(model).generate(prompt, **kwargs))
+                for model in (self.default_model, self.fallback_model)
+            }
+            result = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result["status"] == "ok":
+                        for pending in tasks:
+                            pending.cancel()
+                        return result
+            return result
+
         # Try default model first
         client = self.get_client(self.default_model)
         result = await client.generate(prompt, **kwargs)
-        
+
         if result["status"] == "ok":
             return result
-        
+
         # Fallback to alternative model
         logger.info(f"Primary model failed, trying fallback: {self.fallback_model}")
         client = self.get_client(self.fallback_model)
         return await client.generate(prompt, **kwargs)
     
-    async def set_default_model(self, model: str):
-        """Set default model"""
+    async def generate_many(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Generate completions for several prompts concurrently.
+
+        The per-endpoint semaphore shapes fan-out to the backend's
+        parallelism, so callers may pass arbitrarily many prompts.
+        """
+        return await asyncio.gather(
+            *(self.generate_with_fallback(p, **kwargs) for p in prompts))
+
+    def set_default_model(self, model: str) -> None:
+        """Set default model (no I/O, so no reason to be a coroutine)"""
         self.default_model = model
         logger.info(f"Default model set to: {model}")
     
     def list_available_models(self) -> List[str]:
         """List available models"""
-        return list(self.clients.keys())
+        return list(self._models_tuple)
+
+    async def aclose(self):
+        """Close the pooled HTTP sessions on shutdown"""
+        for session in _SESSIONS.values():
+            if not session.closed:
+                await session.close()
+        _SESSIONS.clear()
@@ -5,13 +5,60 @@ Provides task scheduling, reminders, and cron-like functionality.
 """
 
 import asyncio
+import heapq
 import json
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_indent(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dumps_indent(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+
+# Relative-time suffix multipliers, e.g. "+30m" -> 1800 seconds
+_UNIT_MULT = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+@lru_cache(maxsize=4096)
+def _ts_to_iso(ts: float) -> str:
+    """ISO string for a timestamp; batch-created tasks share timestamps,
+    so repeats on list/get paths become dict hits."""
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+@lru_cache(maxsize=1024)
+def _duration_str(s: int) -> str:
+    if s < 60:
+        return f"{s}s"
+    m, _ = divmod(s, 60)
+    if m < 60:
+        return f"{m}m"
+    h, m = divmod(m, 60)
+    if h < 24:
+        return f"{h}h {m}m"
+    d, h = divmod(h, 24)
+    return f"{d}d {h}h"
 
 
 class TaskStatus(str, Enum):
@@ -30,7 +77,7 @@ class RepeatType(str, Enum):
     CUSTOM = "custom"  # Custom interval in seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     name: str
@@ -48,11 +95,33 @@ class Task:
     enabled: bool = True
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
-    
+        # Flat dict build; dataclasses.asdict would deep-copy every field
+        d = {name: getattr(self, name) for name in self.__slots__}
+        # Accept plain strings too (callers can setattr them directly)
+        d['status'] = TaskStatus(d['status']).value
+        d['repeat'] = RepeatType(d['repeat']).value
+        return d
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
-        return cls(**data)
+        # Bypass the generated __init__: snapshots come from to_dict and
+        # always carry every field, so signature binding buys nothing on
+        # a 10k-task load
+        task = object.__new__(cls)
+        for name in cls.__slots__:
+            setattr(task, name, data[name])
+        task.status = TaskStatus(data.get('status', TaskStatus.PENDING))
+        task.repeat = RepeatType(data.get('repeat', RepeatType.ONCE))
+        return task
+
+
+# Seconds to advance per repeat type (month approximated as 30 days);
+# CUSTOM uses the task's own interval
+_REPEAT_DELTA = {
+    RepeatType.DAILY: 86400,
+    RepeatType.WEEKLY: 604800,
+    RepeatType.MONTHLY: 86400 * 30,
+}
 
 
 class Scheduler:
@@ -61,35 +130,88 @@ class Scheduler:
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
         self.tasks_file = state_dir / 'scheduled_tasks.json'
+        self.journal_file = state_dir / 'scheduled_tasks.log'
         self.tasks: Dict[str, Task] = {}
         self.running = False
+        self._dirty = False
+        # Min-heap of (next_run, task_id); stale entries are skipped at pop
+        # time (lazy deletion) rather than removed on cancel/update
+        self._heap: List[tuple] = []
         self._load_tasks()
-    
+        for task_id, task in self.tasks.items():
+            if task.enabled and task.next_run:
+                self._heap.append((task.next_run, task_id))
+        heapq.heapify(self._heap)
+
     def _load_tasks(self):
-        """Load tasks from disk"""
+        """Load the snapshot from disk, then replay the mutation journal"""
         if self.tasks_file.exists():
             try:
-                with open(self.tasks_file, 'r') as f:
-                    data = json.load(f)
-                    self.tasks = {
-                        task_id: Task.from_dict(task_data)
-                        for task_id, task_data in data.items()
-                    }
+                data = _loads(self.tasks_file.read_bytes())
+                self.tasks = {
+                    task_id: Task.from_dict(task_data)
+                    for task_id, task_data in data.items()
+                }
             except Exception as e:
                 print(f"Error loading tasks: {e}")
-    
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        entry = _loads(line)
+                        if entry['op'] == 'delete':
+                            self.tasks.pop(entry['id'], None)
+                        else:
+                            self.tasks[entry['id']] = Task.from_dict(entry['task'])
+                # Fold the replayed journal into the next snapshot
+                self._dirty = True
+            except Exception as e:
+                print(f"Error replaying task journal: {e}")
+
     def _save_tasks(self):
-        """Save tasks to disk"""
+        """Write the full snapshot and truncate the journal"""
         try:
             self.tasks_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.tasks_file, 'w') as f:
-                json.dump(
-                    {task_id: task.to_dict() for task_id, task in self.tasks.items()},
-                    f,
-                    indent=2
-                )
+            data = _dumps_indent(
+                {task_id: task.to_dict() for task_id, task in self.tasks.items()})
+            # Write-then-rename so a crash mid-write never corrupts the
+            # snapshot
+            tmp = self.tasks_file.with_suffix('.json.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, self.tasks_file)
+            if self.journal_file.exists():
+                self.journal_file.write_text('')
+            self._dirty = False
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+
+    def _record_mutation(self, op: str, task_id: str, task: Task = None):
+        """Append one journal line per mutation instead of rewriting the snapshot.
+
+        The snapshot is rewritten lazily (scheduler tick, or when the journal
+        outgrows it), so each mutation costs O(1) bytes instead of O(tasks).
+        """
+        self._dirty = True
+        entry = {'op': op, 'id': task_id}
+        if task is not None:
+            entry['task'] = task.to_dict()
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, 'ab') as f:
+                f.write(_dumps(entry) + b'\n')
+            snapshot_size = self.tasks_file.stat().st_size if self.tasks_file.exists() else 0
+            if self.journal_file.stat().st_size > 4 * max(snapshot_size, 16384):
+                self._save_tasks()  # compact
         except Exception as e:
             print(f"Error saving tasks: {e}")
+
+    def _flush(self):
+        """Write the snapshot only if something changed since the last one"""
+        if self._dirty:
+            self._save_tasks()
     
     def create_task(self, name: str, description: str, command: str,
                    scheduled_time: str, repeat: str = "once",
@@ -130,13 +252,14 @@ class Scheduler:
             )
             
             self.tasks[task_id] = task
-            self._save_tasks()
+            heapq.heappush(self._heap, (task.next_run, task_id))
+            self._record_mutation('upsert', task_id, task)
             
             return {
                 'status': 'ok',
                 'task_id': task_id,
                 'task': task.to_dict(),
-                'scheduled_datetime': datetime.fromtimestamp(timestamp).isoformat()
+                'scheduled_datetime': _ts_to_iso(timestamp)
             }
         
         except Exception as e:
@@ -148,57 +271,50 @@ class Scheduler:
     def _parse_relative_time(self, relative: str) -> float:
         """Parse relative time strings like '+1h', '+30m', '+2d'"""
         relative = relative[1:]  # Remove '+'
-        
-        units = {
-            's': 1,
-            'm': 60,
-            'h': 3600,
-            'd': 86400,
-            'w': 604800,
-        }
-        
-        for unit, multiplier in units.items():
-            if relative.endswith(unit):
-                value = int(relative[:-1])
-                return value * multiplier
-        
-        raise ValueError(f"Invalid relative time format: {relative}")
+
+        multiplier = _UNIT_MULT.get(relative[-1:])
+        if multiplier is None:
+            raise ValueError(f"Invalid relative time format: {relative}")
+        return int(relative[:-1]) * multiplier
     
     def list_tasks(self, status: str = None, enabled: bool = None) -> List[Dict[str, Any]]:
         """List all tasks with optional filtering"""
+        # Compose the filter once instead of re-testing both arguments
+        # per task; the unfiltered case pays no predicate at all
+        if status is None and enabled is None:
+            pred = None
+        elif status is None:
+            pred = lambda t: t.enabled == enabled
+        elif enabled is None:
+            pred = lambda t: t.status == status
+        else:
+            pred = lambda t: t.status == status and t.enabled == enabled
+
         tasks = []
-        
+        now = time.time()
+
         for task in self.tasks.values():
-            if status and task.status != status:
-                continue
-            if enabled is not None and task.enabled != enabled:
+            if pred is not None and not pred(task):
                 continue
-            
+
             task_dict = task.to_dict()
             
             # Add human-readable times
-            task_dict['scheduled_datetime'] = datetime.fromtimestamp(task.scheduled_time).isoformat()
+            task_dict['scheduled_datetime'] = _ts_to_iso(task.scheduled_time)
             if task.next_run:
-                task_dict['next_run_datetime'] = datetime.fromtimestamp(task.next_run).isoformat()
-                task_dict['time_until_next_run'] = self._format_duration(task.next_run - time.time())
+                task_dict['next_run_datetime'] = _ts_to_iso(task.next_run)
+                task_dict['time_until_next_run'] = self._format_duration(task.next_run - now)
             
             tasks.append(task_dict)
         
-        return sorted(tasks, key=lambda x: x.get('next_run', 0))
+        tasks.sort(key=lambda x: x.get('next_run') or 0)
+        return tasks
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format"""
         if seconds < 0:
             return "overdue"
-        
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            return f"{int(seconds / 60)}m"
-        elif seconds < 86400:
-            return f"{int(seconds / 3600)}h {int((seconds % 3600) / 60)}m"
-        else:
-            return f"{int(seconds / 86400)}d {int((seconds % 86400) / 3600)}h"
+        return _duration_str(int(seconds))
     
     def get_task(self, task_id: str) -> Dict[str, Any]:
         """Get task details"""
@@ -207,9 +323,9 @@ class Scheduler:
         
         task = self.tasks[task_id]
         task_dict = task.to_dict()
-        task_dict['scheduled_datetime'] = datetime.fromtimestamp(task.scheduled_time).isoformat()
+        task_dict['scheduled_datetime'] = _ts_to_iso(task.scheduled_time)
         if task.next_run:
-            task_dict['next_run_datetime'] = datetime.fromtimestamp(task.next_run).isoformat()
+            task_dict['next_run_datetime'] = _ts_to_iso(task.next_run)
         
         return {'status': 'ok', 'task': task_dict}
     
@@ -219,12 +335,24 @@ class Scheduler:
             return {'status': 'error', 'error': 'Task not found'}
         
         task = self.tasks[task_id]
-        
+
+        # Normalize enum fields before touching the task so an invalid
+        # value cannot leave it half-updated
+        try:
+            if 'status' in updates:
+                updates['status'] = TaskStatus(updates['status'])
+            if 'repeat' in updates:
+                updates['repeat'] = RepeatType(updates['repeat'])
+        except ValueError as e:
+            return {'status': 'error', 'error': str(e)}
+
         for key, value in updates.items():
             if hasattr(task, key):
                 setattr(task, key, value)
-        
-        self._save_tasks()
+
+        if task.enabled and task.next_run:
+            heapq.heappush(self._heap, (task.next_run, task_id))
+        self._record_mutation('upsert', task_id, task)
         
         return {'status': 'ok', 'task': task.to_dict()}
     
@@ -236,7 +364,7 @@ class Scheduler:
         task = self.tasks[task_id]
         task.status = TaskStatus.CANCELLED
         task.enabled = False
-        self._save_tasks()
+        self._record_mutation('upsert', task_id, task)
         
         return {'status': 'ok', 'message': f'Task {task_id} cancelled'}
     
@@ -246,35 +374,52 @@ class Scheduler:
             return {'status': 'error', 'error': 'Task not found'}
         
         del self.tasks[task_id]
-        self._save_tasks()
+        self._record_mutation('delete', task_id)
         
         return {'status': 'ok', 'message': f'Task {task_id} deleted'}
     
     async def run_scheduler(self, executor_callback):
         """
         Run the scheduler loop.
-        Checks for due tasks every 10 seconds.
-        
+
+        Pops due tasks off the (next_run, id) heap in O(log K) each and
+        sleeps until the next deadline (capped at 10 s) instead of
+        scanning every task on a fixed poll.
+
         Args:
             executor_callback: Async function to execute tasks
         """
         self.running = True
-        
+
         while self.running:
             try:
                 current_time = time.time()
-                
-                for task in list(self.tasks.values()):
-                    if not task.enabled or task.status == TaskStatus.CANCELLED:
-                        continue
-                    
-                    if task.next_run and current_time >= task.next_run:
-                        # Execute task
-                        await self._execute_task(task, executor_callback)
-                
-                # Sleep for 10 seconds
-                await asyncio.sleep(10)
-            
+
+                while self._heap and self._heap[0][0] <= current_time:
+                    _, task_id = heapq.heappop(self._heap)
+                    task = self.tasks.get(task_id)
+                    if task is None or not task.enabled or task.status == TaskStatus.CANCELLED:
+                        continue  # stale entry: task cancelled or deleted
+                    if not task.next_run or task.next_run > current_time:
+                        continue  # stale entry: task was rescheduled
+                    # Execute task
+                    await self._execute_task(task, executor_callback)
+                    # Re-push even when the recomputed next_run is already
+                    # due (interval shorter than the execution took, or
+                    # catch-up after downtime); the stale-entry guards
+                    # above make duplicate heap entries harmless
+                    if task.enabled and task.next_run:
+                        heapq.heappush(self._heap, (task.next_run, task_id))
+
+                # One snapshot per tick at most, and only when dirty
+                self._flush()
+
+                # Sleep until the next deadline, at most 10 seconds
+                delay = 10.0
+                if self._heap:
+                    delay = min(delay, max(0.1, self._heap[0][0] - time.time()))
+                await asyncio.sleep(delay)
+
             except Exception as e:
                 print(f"Scheduler error: {e}")
                 await asyncio.sleep(10)
@@ -284,8 +429,8 @@ class Scheduler:
         try:
             task.status = TaskStatus.RUNNING
             task.last_run = time.time()
-            self._save_tasks()
-            
+            self._record_mutation('upsert', task.id, task)
+
             # Execute via callback
             result = await executor_callback(task.command)
             
@@ -301,29 +446,21 @@ class Scheduler:
                     task.next_run = self._calculate_next_run(task)
             else:
                 task.enabled = False
-            
-            self._save_tasks()
-        
+
+            self._record_mutation('upsert', task.id, task)
+
         except Exception as e:
             task.status = TaskStatus.FAILED
-            self._save_tasks()
+            self._record_mutation('upsert', task.id, task)
             print(f"Task {task.id} execution failed: {e}")
     
     def _calculate_next_run(self, task: Task) -> float:
         """Calculate next run time for repeating tasks"""
         current = task.next_run or time.time()
-        
-        if task.repeat == RepeatType.DAILY:
-            return current + 86400
-        elif task.repeat == RepeatType.WEEKLY:
-            return current + 604800
-        elif task.repeat == RepeatType.MONTHLY:
-            # Approximate month as 30 days
-            return current + (86400 * 30)
-        elif task.repeat == RepeatType.CUSTOM:
+
+        if task.repeat == RepeatType.CUSTOM:
             return current + task.repeat_interval
-        else:
-            return current
+        return current + _REPEAT_DELTA.get(task.repeat, 0)
     
     def stop_scheduler(self):
         """Stop the scheduler loop"""
@@ -353,7 +490,7 @@ class Scheduler:
         for task in self.tasks.values():
             if task.enabled and task.next_run and task.next_run > current_time:
                 task_dict = task.to_dict()
-                task_dict['next_run_datetime'] = datetime.fromtimestamp(task.next_run).isoformat()
+                task_dict['next_run_datetime'] = _ts_to_iso(task.next_run)
                 task_dict['time_until'] = self._format_duration(task.next_run - current_time)
                 upcoming.append(task_dict)
         
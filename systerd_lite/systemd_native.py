@@ -9,14 +9,52 @@ This is the REAL systemd integration - not a wrapper.
 """
 
 import os
-import subprocess
 import asyncio
 import logging
+import re
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# The only systemctl show properties we surface; filtering by prefix
+# avoids splitting the ~120 other lines per unit
+_NEEDED_PROPS = ('ActiveState=', 'SubState=', 'LoadState=')
+
+# One row of systemctl list-units --no-legend output
+_UNIT_LINE = re.compile(r'^\s*(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s*(.*)$')
+
+
+def _scan_unit_dir(path: Path) -> List[tuple]:
+    """Collect (name, path, content) for *.service files in one directory.
+
+    Runs in a worker thread; os.scandir filters on the name without a
+    stat per entry, unlike Path.glob.
+    """
+    out = []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return out
+    with it:
+        for entry in it:
+            if not entry.name.endswith(".service"):
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                # Only the 200-byte snippet is kept, so don't read (or
+                # allocate) the rest of the file
+                with open(entry.path, 'rb') as f:
+                    content = f.read(200)
+                out.append((entry.name, entry.path,
+                            content.decode('utf-8', errors='replace')))
+            except OSError as e:
+                logger.warning(f"Failed to reload {entry.name}: {e}")
+    return out
+
 
 class SystemdNative:
     """
@@ -41,6 +79,17 @@ class SystemdNative:
         # Unit state tracking
         self.unit_states: Dict[str, Dict[str, Any]] = {}
         self.failed_units: set = set()
+        # Short-TTL cache over batched systemctl show queries; a single
+        # (key, ts, states) slot, since only the most recent query can
+        # hit within the 1 s TTL and a dict would grow without bound
+        self._states_cache: Optional[tuple] = None
+        # Failed-unit changes are journaled as +unit/-unit lines and
+        # replayed on startup; compacted when the log outgrows the set
+        self.failed_log = self.systemd_run_dir / "systerd_failed_units.log"
+        self._load_failed_units()
+        # Last payload written to systerd_manager_state; unchanged
+        # payloads skip the write syscall entirely
+        self._last_manager_state: Optional[str] = None
         
         logger.info(f"SystemdNative initialized with state_dir={state_dir}")
     
@@ -62,30 +111,26 @@ class SystemdNative:
                 self.units_dir,
             ]
             
+            # Scan the four directories concurrently off the event loop
+            scans = await asyncio.gather(
+                *(asyncio.to_thread(_scan_unit_dir, p) for p in unit_paths))
+
             reloaded_units = []
-            for unit_path in unit_paths:
-                if not unit_path.exists():
-                    continue
-                
-                for unit_file in unit_path.glob("*.service"):
-                    unit_name = unit_file.name
-                    try:
-                        # Parse unit file (simplified)
-                        with open(unit_file, 'r') as f:
-                            content = f.read()
-                        
-                        self.unit_states[unit_name] = {
-                            "path": str(unit_file),
-                            "loaded": True,
-                            "content": content[:200]  # Store snippet
-                        }
-                        reloaded_units.append(unit_name)
-                    except Exception as e:
-                        logger.warning(f"Failed to reload {unit_name}: {e}")
+            for scanned in scans:
+                for unit_name, unit_path, snippet in scanned:
+                    self.unit_states[unit_name] = {
+                        "path": unit_path,
+                        "loaded": True,
+                        "content": snippet  # Store snippet
+                    }
+                    reloaded_units.append(unit_name)
             
-            # Create systemd manager state file
-            state_file = self.systemd_run_dir / "systerd_manager_state"
-            state_file.write_text(f"reloaded_units={len(reloaded_units)}\n")
+            # Create systemd manager state file (skip if unchanged)
+            payload = f"reloaded_units={len(reloaded_units)}\n"
+            if payload != self._last_manager_state:
+                state_file = self.systemd_run_dir / "systerd_manager_state"
+                state_file.write_text(payload)
+                self._last_manager_state = payload
             
             logger.info(f"[NATIVE] daemon-reload complete: {len(reloaded_units)} units reloaded")
             
@@ -104,10 +149,37 @@ class SystemdNative:
                 "implementation": "systerd-native"
             }
     
+    def _load_failed_units(self):
+        """Replay the failed-units journal into the in-memory set."""
+        try:
+            with open(self.failed_log, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if line[0] == '+':
+                        self.failed_units.add(line[1:])
+                    elif line[0] == '-':
+                        self.failed_units.discard(line[1:])
+        except OSError:
+            pass
+
+    def _append_failed_log(self, entry: str):
+        """Append one +unit/-unit line; compact when the log gets stale-heavy."""
+        try:
+            with open(self.failed_log, 'a') as f:
+                f.write(entry + '\n')
+            live = sum(len(u) + 2 for u in self.failed_units)
+            if self.failed_log.stat().st_size > max(1024, 2 * live):
+                self.failed_log.write_text(
+                    ''.join(f'+{u}\n' for u in self.failed_units))
+        except OSError as e:
+            logger.warning(f"Failed to journal failed-unit change: {e}")
+
     async def reset_failed(self, unit: Optional[str] = None) -> Dict[str, Any]:
         """
         Native implementation of systemctl reset-failed.
-        
+
         Clears the failed state of units.
         Equivalent to systemd's Manager.ResetFailed() D-Bus method.
         """
@@ -116,6 +188,7 @@ class SystemdNative:
                 logger.info(f"[NATIVE] Resetting failed state for unit: {unit}")
                 if unit in self.failed_units:
                     self.failed_units.remove(unit)
+                    self._append_failed_log(f'-{unit}')
                     reset_count = 1
                 else:
                     reset_count = 0
@@ -123,10 +196,11 @@ class SystemdNative:
                 logger.info(f"[NATIVE] Resetting all failed units ({len(self.failed_units)} units)")
                 reset_count = len(self.failed_units)
                 self.failed_units.clear()
-            
-            # Update systemd state file
-            state_file = self.systemd_run_dir / "systerd_failed_units"
-            state_file.write_text("\n".join(self.failed_units))
+                # One truncate instead of rewriting the whole set
+                try:
+                    self.failed_log.write_text('')
+                except OSError as e:
+                    logger.warning(f"Failed to truncate failed-unit journal: {e}")
             
             logger.info(f"[NATIVE] reset-failed complete: {reset_count} units reset")
             
@@ -145,70 +219,111 @@ class SystemdNative:
                 "implementation": "systerd-native"
             }
     
+    async def _run_systemctl(self, *args: str) -> tuple:
+        """Run systemctl without blocking the event loop; kills on timeout."""
+        proc = await asyncio.create_subprocess_exec(
+            "systemctl", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stdout.decode()
+
     async def get_unit_state(self, unit: str) -> Dict[str, Any]:
         """Get current state of a unit."""
+        return (await self.get_unit_states([unit]))[unit]
+
+    def _internal_state(self, unit: str) -> Dict[str, Any]:
+        """Fallback answer from internal tracking when systemctl is unusable."""
+        state = self.unit_states.get(unit, {})
+        return {
+            "unit": unit,
+            "active_state": "unknown",
+            "sub_state": "unknown",
+            "load_state": "loaded" if state.get("loaded") else "not-found",
+            "source": "systerd-internal"
+        }
+
+    async def get_unit_states(self, units: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get current state of several units with one systemctl invocation.
+
+        systemctl show accepts multiple units and separates the records
+        with blank lines, so N queries cost one fork + one D-Bus round
+        trip. Results are cached for 1 s against rapid UI re-queries.
+        """
+        if not units:
+            return {}
+
+        cache_key = tuple(units)
+        now = time.monotonic()
+        cached = self._states_cache
+        if cached is not None and cached[0] == cache_key and now - cached[1] < 1.0:
+            return cached[2]
+
         try:
             # Try systemctl first (if systemd is available)
-            result = subprocess.run(
-                ["systemctl", "show", unit, "--no-pager"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                # Parse systemctl output
-                props = {}
-                for line in result.stdout.splitlines():
-                    if "=" in line:
-                        k, v = line.split("=", 1)
-                        props[k] = v
-                
-                return {
-                    "unit": unit,
-                    "active_state": props.get("ActiveState", "unknown"),
-                    "sub_state": props.get("SubState", "unknown"),
-                    "load_state": props.get("LoadState", "unknown"),
-                    "source": "systemctl"
-                }
+            returncode, stdout = await self._run_systemctl(
+                "show", "--no-pager", "--", *units)
+
+            if returncode == 0 and stdout.strip():
+                states = {}
+                # Records arrive blank-line separated, in argument order
+                for unit, block in zip(units, stdout.strip().split("\n\n")):
+                    props = {}
+                    for line in block.splitlines():
+                        for prefix in _NEEDED_PROPS:
+                            if line.startswith(prefix):
+                                props[prefix[:-1]] = line[len(prefix):]
+                                break
+                        if len(props) == 3:
+                            break
+
+                    states[unit] = {
+                        "unit": unit,
+                        "active_state": props.get("ActiveState", "unknown"),
+                        "sub_state": props.get("SubState", "unknown"),
+                        "load_state": props.get("LoadState", "unknown"),
+                        "source": "systemctl"
+                    }
+                for unit in units:
+                    states.setdefault(unit, self._internal_state(unit))
             else:
                 # Fallback to internal state
-                state = self.unit_states.get(unit, {})
-                return {
-                    "unit": unit,
-                    "active_state": "unknown",
-                    "sub_state": "unknown",
-                    "load_state": "loaded" if state.get("loaded") else "not-found",
-                    "source": "systerd-internal"
-                }
-                
-        except subprocess.TimeoutExpired:
-            return {"error": "Timeout querying unit state"}
+                states = {unit: self._internal_state(unit) for unit in units}
+
+        except asyncio.TimeoutError:
+            return {unit: {"error": "Timeout querying unit state"} for unit in units}
         except Exception as e:
-            return {"error": str(e)}
+            return {unit: {"error": str(e)} for unit in units}
+
+        self._states_cache = (cache_key, now, states)
+        return states
     
     async def list_units(self, pattern: str = "*") -> List[Dict[str, Any]]:
         """List all units matching pattern."""
         try:
             # Try systemctl first
-            result = subprocess.run(
-                ["systemctl", "list-units", "--all", "--no-pager", "--no-legend"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
+            returncode, stdout = await self._run_systemctl(
+                "list-units", "--all", "--no-pager", "--no-legend")
+
+            if returncode == 0:
                 units = []
-                for line in result.stdout.splitlines():
-                    parts = line.split(None, 4)
-                    if len(parts) >= 4:
-                        units.append({
-                            "name": parts[0],
-                            "load": parts[1],
-                            "active": parts[2],
-                            "sub": parts[3],
-                            "description": parts[4] if len(parts) > 4 else ""
+                match = _UNIT_LINE.match
+                append = units.append
+                for line in stdout.splitlines():
+                    m = match(line)
+                    if m:
+                        append({
+                            "name": m[1],
+                            "load": m[2],
+                            "active": m[3],
+                            "sub": m[4],
+                            "description": m[5]
                         })
                 return units
             else:
@@ -229,13 +344,19 @@ class SystemdNative:
             return []
 
 
-# Global instance
+# Global instance; construction stays lazy because the ctor creates
+# /run/systemd state dirs, which would make importing fail for non-root
 _systemd_native_instance: Optional[SystemdNative] = None
+_instance_lock = threading.Lock()
 
 
 def get_systemd_native() -> SystemdNative:
-    """Get the global SystemdNative instance."""
+    """Get the global SystemdNative instance (init-once, thread-safe)."""
     global _systemd_native_instance
-    if _systemd_native_instance is None:
-        _systemd_native_instance = SystemdNative()
-    return _systemd_native_instance
+    instance = _systemd_native_instance
+    if instance is None:
+        with _instance_lock:
+            instance = _systemd_native_instance
+            if instance is None:
+                instance = _systemd_native_instance = SystemdNative()
+    return instance
@@ -65,19 +65,10 @@ def test_systemd():
     # Use a temp dir for state to avoid messing with real system
     with tempfile.TemporaryDirectory() as tmpdir:
         sysd = SystemdNative(state_dir=tmpdir)
-        
-        # List units (this might fail if not running as root or no access to systemd, 
-def test_systemd():
-    print("\n=== Testing SystemdNative ===")
-    # Use a temp dir for state to avoid messing with real system
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sysd = SystemdNative(state_dir=tmpdir)
-        
+
         # Trigger daemon_reload to populate unit_states
         import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        res = loop.run_until_complete(sysd.daemon_reload())
+        res = asyncio.run(sysd.daemon_reload())
         print(f"Reload result: {res}")
         
         units = sysd.unit_states